@@ -4,14 +4,62 @@ Parse Claude Code local JSONL files to extract usage data.
 """
 
 import json
+import logging
+import multiprocessing
+import os
+import pickle
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
+# orjson is optional; when installed it decodes and encodes JSON noticeably
+# faster than the stdlib json module and returns the same plain dicts/lists.
+# The other modules use these helpers rather than importing orjson themselves.
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-@dataclass
+json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+
+def json_indented(data: Dict[str, Any]) -> bytes:
+    """Serialize data as UTF-8 encoded JSON indented by two spaces."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def json_line(data: Dict[str, Any]) -> bytes:
+    """Serialize data as one UTF-8 encoded JSONL line."""
+    if HAS_ORJSON:
+        return orjson.dumps(data) + b"\n"
+    return (json.dumps(data) + "\n").encode()
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+# datetime.fromisoformat() accepts a trailing "Z" natively from Python 3.11,
+# which saves a str.replace() allocation per timestamp. Shared with the
+# OAuth API client, whose reset times use the same format.
+if sys.version_info >= (3, 11):
+    parse_timestamp = datetime.fromisoformat
+else:
+    def parse_timestamp(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+# Dataclasses created per message or per poll drop the per-instance
+# __dict__ where dataclass supports it (Python 3.10+).
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TokenUsage:
     """Token usage for a single message."""
     input_tokens: int = 0
@@ -35,7 +83,7 @@ class TokenUsage:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MessageData:
     """Data from a single Claude message."""
     timestamp: datetime
@@ -44,15 +92,16 @@ class MessageData:
     project: str
     request_id: str
     conversation_id: str
+    date_key: str = ""  # "YYYY-MM-DD" of timestamp, used for daily aggregation
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UsageStats:
     """Aggregated usage statistics."""
     total_usage: TokenUsage = field(default_factory=TokenUsage)
-    by_model: Dict[str, TokenUsage] = field(default_factory=lambda: defaultdict(TokenUsage))
-    by_date: Dict[str, TokenUsage] = field(default_factory=lambda: defaultdict(TokenUsage))
-    by_project: Dict[str, TokenUsage] = field(default_factory=lambda: defaultdict(TokenUsage))
+    by_model: Dict[str, TokenUsage] = field(default_factory=dict)
+    by_date: Dict[str, TokenUsage] = field(default_factory=dict)
+    by_project: Dict[str, TokenUsage] = field(default_factory=dict)
     message_count: int = 0
     date_range: tuple = field(default_factory=lambda: (None, None))
 
@@ -83,6 +132,28 @@ class ClaudeDataParser:
         }
     }
 
+    # Model name substrings (matched against the lower-cased name, in order)
+    # mapped to their pricing; unknown models fall back to Sonnet pricing
+    PRICING_RULES = (
+        ("sonnet-4", PRICING["claude-sonnet-4-5"]),
+        ("opus-4", PRICING["claude-opus-4-5"]),
+        ("haiku", PRICING["claude-3-5-haiku"]),
+    )
+    DEFAULT_PRICING = PRICING["claude-sonnet-4-5"]
+
+    # Minimum number of conversation files before parsing is spread across
+    # worker processes
+    PARALLEL_MIN_FILES = 64
+
+    # Number of conversation files read ahead on threads when parsing serially
+    PREFETCH_FILES = 8
+
+    # Each file's token totals are cached, keyed by (mtime, size), so warm
+    # runs only parse conversations that changed since the last run.
+    # Bump CACHE_VERSION whenever the entry layout changes.
+    CACHE_FILE = Path.home() / ".claudeusagetracker" / "parse_cache.pkl"
+    CACHE_VERSION = 2
+
     def __init__(self, claude_dir: Optional[Path] = None):
         """
         Initialize parser.
@@ -92,19 +163,30 @@ class ClaudeDataParser:
         """
         self.claude_dir = claude_dir or Path.home() / ".claude"
         self.projects_dir = self.claude_dir / "projects"
+        # path -> (mtime_ns, size, resume offset, file totals); see _group_messages
+        self._file_cache: Optional[Dict[str, tuple]] = None
+        # model name -> pricing, so each distinct name is matched only once
+        self._pricing_cache: Dict[str, Dict[str, float]] = {}
+        # Last get_usage_summary() result and the file stats it was built from
+        self._summary: Optional[UsageStats] = None
+        self._summary_signature: Optional[list] = None
 
     def get_model_pricing(self, model_name: str) -> Optional[Dict[str, float]]:
         """Get pricing for a model."""
+        pricing = self._pricing_cache.get(model_name)
+        if pricing is not None:
+            return pricing
+
         # Normalize model name to match pricing keys
-        if "sonnet-4" in model_name.lower():
-            return self.PRICING["claude-sonnet-4-5"]
-        elif "opus-4" in model_name.lower():
-            return self.PRICING["claude-opus-4-5"]
-        elif "haiku" in model_name.lower():
-            return self.PRICING["claude-3-5-haiku"]
-        else:
-            # Default to Sonnet pricing for unknown models
-            return self.PRICING["claude-sonnet-4-5"]
+        name = model_name.lower()
+        pricing = self.DEFAULT_PRICING
+        for key, rule_pricing in self.PRICING_RULES:
+            if key in name:
+                pricing = rule_pricing
+                break
+
+        self._pricing_cache[model_name] = pricing
+        return pricing
 
     def calculate_cost(self, usage: TokenUsage, model: str) -> float:
         """Calculate cost in USD for token usage."""
@@ -120,16 +202,19 @@ class ClaudeDataParser:
         )
         return cost
 
-    def parse_message(self, line: str, project: str, conversation_id: str) -> Optional[MessageData]:
-        """Parse a single JSONL line."""
+    def parse_message(self, line: Union[str, bytes], project: str, conversation_id: str) -> Optional[MessageData]:
+        """Parse a single JSONL line (str or raw bytes)."""
         try:
-            data = json.loads(line)
+            data = json_loads(line)
 
             # Only process assistant messages with usage data
-            if data.get("type") != "assistant" or "usage" not in data.get("message", {}):
+            if data.get("type") != "assistant":
+                return None
+
+            message = data.get("message")
+            if not message or "usage" not in message:
                 return None
 
-            message = data["message"]
             usage_data = message["usage"]
 
             # Extract token counts
@@ -141,7 +226,7 @@ class ClaudeDataParser:
             )
 
             # Parse timestamp
-            timestamp = datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00"))
+            timestamp = parse_timestamp(data["timestamp"])
 
             return MessageData(
                 timestamp=timestamp,
@@ -149,90 +234,357 @@ class ClaudeDataParser:
                 usage=usage,
                 project=project,
                 request_id=data.get("requestId", ""),
-                conversation_id=conversation_id
+                conversation_id=conversation_id,
+                date_key=timestamp.isoformat()[:10]
             )
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (ValueError, KeyError):
             # Skip malformed lines
             return None
 
-    def parse_conversation(self, jsonl_file: Path, project: str) -> List[MessageData]:
-        """Parse a single conversation JSONL file."""
-        messages = []
-        conversation_id = jsonl_file.stem
+    def parse_conversation(self, jsonl_file: Union[str, Path], project: str) -> Iterator[MessageData]:
+        """Parse a single conversation JSONL file, yielding its messages."""
+        messages, _ = self._parse_file(jsonl_file, project)
+        yield from messages
+
+    def _parse_file(self, jsonl_file: Union[str, Path], project: str,
+                    offset: int = 0) -> Tuple[List[MessageData], Optional[int]]:
+        """
+        Parse a conversation file starting at byte `offset`.
+
+        Returns the parsed messages and the offset to resume from once more
+        lines are appended (None if the file could not be read).
+        """
+        data = self._read_file(jsonl_file, offset)
+        return self._parse_data(data, jsonl_file, project, offset)
 
+    def _read_file(self, jsonl_file: Union[str, Path], offset: int = 0) -> Optional[bytes]:
+        """Read a conversation file from byte `offset` (None on error)."""
         try:
-            with open(jsonl_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    msg = self.parse_message(line, project, conversation_id)
-                    if msg:
-                        messages.append(msg)
+            # Read the whole file at once and split on raw bytes; json.loads
+            # accepts bytes and tolerates surrounding whitespace, so there is
+            # no need to decode or strip each line.
+            with open(jsonl_file, 'rb') as f:
+                if offset:
+                    f.seek(offset)
+                return f.read()
         except Exception as e:
             print(f"Error parsing {jsonl_file}: {e}")
+            return None
 
-        return messages
+    def _parse_data(self, data: Optional[bytes], jsonl_file: Union[str, Path], project: str,
+                    offset: int = 0) -> Tuple[List[MessageData], Optional[int]]:
+        """Parse conversation bytes read from `jsonl_file` at `offset`."""
+        messages = []
+        if data is None:
+            return messages, None
+
+        conversation_id = os.path.splitext(os.path.basename(jsonl_file))[0]
+        lines = data.split(b'\n')
+        # Resume after the last complete line. A trailing line without a
+        # newline may still be mid-write, so it is only skipped next time
+        # if it already parsed into a message.
+        resume_offset = offset + len(data) - len(lines[-1])
+
+        for i, line in enumerate(lines):
+            # Cheap byte scan first: only assistant messages carrying
+            # usage data are of interest, so skip everything else
+            # (user/system/tool lines) without paying for json.loads.
+            if b'"usage"' not in line or b'"assistant"' not in line:
+                continue
 
-    def parse_all_projects(self) -> List[MessageData]:
-        """Parse all projects and return all messages."""
-        all_messages = []
+            msg = self.parse_message(line, project, conversation_id)
+            if msg:
+                messages.append(msg)
+                if i == len(lines) - 1:
+                    resume_offset = offset + len(data)
+
+        return messages, resume_offset
+
+    def _load_cache(self) -> Dict[str, tuple]:
+        """Return the per-file parse cache, reading it from disk on first use."""
+        if self._file_cache is None:
+            self._file_cache = {}
+            try:
+                cached = pickle.loads(self.CACHE_FILE.read_bytes())
+                if cached.get("version") == self.CACHE_VERSION:
+                    self._file_cache = cached["files"]
+            except Exception:
+                # Missing, stale or unreadable cache: start from scratch
+                pass
+        return self._file_cache
+
+    def _save_cache(self):
+        """Write the per-file parse cache to disk."""
+        # The TUI and the daemon may both be reading the cache, so write a
+        # temp file and rename it over the old one: readers then see either
+        # the complete old cache or the complete new one, never a torn file.
+        payload = pickle.dumps({"version": self.CACHE_VERSION, "files": self._file_cache},
+                               protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_file = self.CACHE_FILE.with_name(f"{self.CACHE_FILE.name}.{os.getpid()}.tmp")
+        try:
+            self.CACHE_FILE.parent.mkdir(exist_ok=True)
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, self.CACHE_FILE)
+        except OSError:
+            # The cache only saves work; failing to write it is harmless
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
+    def _scan_files(self) -> List[Tuple[str, str, os.stat_result]]:
+        """List (path, project, stat) for every conversation JSONL file."""
+        files = []
 
         if not self.projects_dir.exists():
             print(f"Projects directory not found: {self.projects_dir}")
-            return all_messages
-
-        # Iterate through all project directories
-        for project_dir in self.projects_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-
-            project_name = project_dir.name
-
-            # Find all JSONL files in project
-            for jsonl_file in project_dir.glob("*.jsonl"):
-                messages = self.parse_conversation(jsonl_file, project_name)
-                all_messages.extend(messages)
-
-        return all_messages
-
-    def aggregate_stats(self, messages: List[MessageData]) -> UsageStats:
-        """Aggregate messages into statistics."""
-        stats = UsageStats()
-
-        if not messages:
-            return stats
-
-        # Sort by timestamp
-        messages.sort(key=lambda m: m.timestamp)
-
-        # Track date range
-        stats.date_range = (messages[0].timestamp, messages[-1].timestamp)
-        stats.message_count = len(messages)
-
-        # Aggregate usage
-        for msg in messages:
-            # Total usage
-            stats.total_usage += msg.usage
-
-            # By model
-            stats.by_model[msg.model] += msg.usage
-
-            # By date
-            date_key = msg.timestamp.strftime("%Y-%m-%d")
-            stats.by_date[date_key] += msg.usage
-
-            # By project
-            stats.by_project[msg.project] += msg.usage
-
-        return stats
+            return files
+
+        # os.scandir reuses the d_type from the directory listing, so this
+        # needs no extra Path object per entry
+        with os.scandir(self.projects_dir) as project_entries:
+            for project_entry in project_entries:
+                if not project_entry.is_dir():
+                    continue
+
+                project_name = project_entry.name
+
+                # Find all JSONL files in project. Unreadable projects and
+                # transcripts pruned since the listing are skipped.
+                try:
+                    file_entries = os.scandir(project_entry.path)
+                except OSError:
+                    continue
+                with file_entries:
+                    for file_entry in file_entries:
+                        if file_entry.name.endswith(".jsonl") and file_entry.is_file():
+                            try:
+                                st = file_entry.stat()
+                            except OSError:
+                                continue
+                            files.append((file_entry.path, project_name, st))
+
+        return files
+
+    def parse_all_projects(self) -> Iterator[MessageData]:
+        """Parse all projects, yielding every message (bypasses the cache)."""
+        for path, project_name, _ in self._scan_files():
+            yield from self.parse_conversation(path, project_name)
+
+    def _parse_files(self, files: List[Tuple[str, str, os.stat_result]]) -> Iterator[tuple]:
+        """Parse scanned conversation files, yielding each file's totals."""
+        # Reuse cached totals for files unchanged since the last run.
+        # Files that only grew are parsed from where the last run stopped
+        # (conversation logs are append-only) and merged into their cached
+        # totals; anything else is parsed from the start.
+        cache = self._load_cache()
+        fresh_cache = {}
+        tasks = []
+        task_info = []
+        for path, project_name, st in files:
+            entry = cache.get(path)
+            if entry is not None:
+                mtime_ns, size, offset, totals = entry
+                if mtime_ns == st.st_mtime_ns and size == st.st_size:
+                    fresh_cache[path] = entry
+                    continue
+                if st.st_size > size:
+                    tasks.append((path, project_name, offset))
+                    task_info.append((st, totals))
+                    continue
+
+            tasks.append((path, project_name, 0))
+            task_info.append((st, None))
+
+        for mtime_ns, size, offset, totals in fresh_cache.values():
+            yield totals
+
+        def record(index, result):
+            """Merge a parse result with any cached prefix and cache it."""
+            st, cached_totals = task_info[index]
+            totals, resume_offset = result
+            if cached_totals is not None:
+                totals = _merge_totals(cached_totals, totals)
+            if resume_offset is not None:
+                fresh_cache[tasks[index][0]] = (st.st_mtime_ns, st.st_size, resume_offset, totals)
+            return totals
+
+        # Files parse independently, so large histories are spread across
+        # worker processes when there is more than one CPU. Small ones stay
+        # serial since starting the pool costs more than it saves. Results
+        # come back in task order, so if the pool breaks midway the serial
+        # path resumes after the files already yielded. The pool can also
+        # fail to start (ValueError) when stderr has been replaced by an
+        # object without a real file descriptor, as inside the TUI.
+        done = 0
+        parsed = False
+        if len(tasks) >= self.PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+            try:
+                with ProcessPoolExecutor(mp_context=_pool_context()) as executor:
+                    for result in executor.map(_parse_conversation_task, tasks, chunksize=4):
+                        yield record(done, result)
+                        done += 1
+                parsed = True
+            except (OSError, ValueError, BrokenProcessPool) as e:
+                logger.warning("Parallel parsing unavailable (%s), parsing serially", e)
+
+        if not parsed:
+            # Read a few files ahead on threads (file IO releases the GIL)
+            # so the disk reads overlap with parsing the current file
+            remaining = tasks[done:]
+            read_ahead = _prefetch(lambda task: self._read_file(task[0], task[2]),
+                                   remaining, self.PREFETCH_FILES)
+            for index, data in enumerate(read_ahead, start=done):
+                messages, resume_offset = self._parse_data(data, *tasks[index])
+                yield record(index, (_group_messages(messages), resume_offset))
+
+        # Files that disappeared drop out of the cache here
+        self._file_cache = fresh_cache
+        if tasks or len(fresh_cache) != len(cache):
+            self._save_cache()
+
+    def aggregate_stats(self, messages: Iterable[MessageData]) -> UsageStats:
+        """Aggregate messages (any iterable, consumed once) into statistics."""
+        return _build_stats([_group_messages(messages)])
 
     def get_usage_summary(self) -> UsageStats:
         """Get complete usage summary from all projects."""
-        messages = self.parse_all_projects()
-        return self.aggregate_stats(messages)
+        # Callers poll this on a timer; when no conversation file has changed
+        # since the last call, the previous summary is still exact
+        files = self._scan_files()
+        signature = [(path, st.st_mtime_ns, st.st_size) for path, _, st in files]
+        if self._summary is not None and signature == self._summary_signature:
+            return self._summary
+
+        # Per-file totals (cached or freshly parsed) stream straight into the
+        # aggregation; individual messages are never retained
+        stats = _build_stats(self._parse_files(files))
+        self._summary = stats
+        self._summary_signature = signature
+        return stats
+
+
+def _prefetch(func, items, depth: int):
+    """Yield func(item) for each item in order, running up to `depth` ahead on threads."""
+    with ThreadPoolExecutor(max_workers=depth) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= depth:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _group_messages(messages: Iterable[MessageData]) -> tuple:
+    """Sum messages into (groups, first timestamp, last timestamp).
+
+    groups maps (model, date_key, project) to a list of input, output,
+    cache creation and cache read token counts plus the message count.
+    Grouping first means each message costs a single dict update, and the
+    counts are summed in place to avoid a TokenUsage per message.
+    """
+    groups = {}
+    first = last = None
+    for msg in messages:
+        timestamp = msg.timestamp
+        if first is None:
+            first = last = timestamp
+        elif timestamp < first:
+            first = timestamp
+        elif timestamp > last:
+            last = timestamp
+        key = (msg.model, msg.date_key, msg.project)
+        counts = groups.get(key)
+        if counts is None:
+            counts = groups[key] = [0, 0, 0, 0, 0]
+        usage = msg.usage
+        counts[0] += usage.input_tokens
+        counts[1] += usage.output_tokens
+        counts[2] += usage.cache_creation_tokens
+        counts[3] += usage.cache_read_tokens
+        counts[4] += 1
+    return groups, first, last
+
+
+def _merge_totals(older: tuple, newer: tuple) -> tuple:
+    """Combine two _group_messages() results, older groups first."""
+    groups = {key: counts[:] for key, counts in older[0].items()}
+    for key, counts in newer[0].items():
+        sums = groups.get(key)
+        if sums is None:
+            groups[key] = counts[:]
+        else:
+            for i in range(5):
+                sums[i] += counts[i]
+    stamps = [stamp for stamp in (older[1], older[2], newer[1], newer[2]) if stamp is not None]
+    if not stamps:
+        return groups, None, None
+    return groups, min(stamps), max(stamps)
+
+
+def _build_stats(all_totals: Iterable[tuple]) -> UsageStats:
+    """Fold _group_messages() results into a UsageStats."""
+    stats = UsageStats()
+
+    # Fold the (few) distinct groups into the per-axis totals, still as
+    # plain count lists, and build one TokenUsage per key at the end.
+    # The date range is tracked in the same pass; order doesn't matter.
+    total = [0, 0, 0, 0]
+    by_model = {}
+    by_date = {}
+    by_project = {}
+    count = 0
+    first = last = None
+    for groups, file_first, file_last in all_totals:
+        if file_first is not None:
+            if first is None or file_first < first:
+                first = file_first
+            if last is None or file_last > last:
+                last = file_last
+        for (model, date_key, project), counts in groups.items():
+            count += counts[4]
+            for i in range(4):
+                total[i] += counts[i]
+            for axis, key in ((by_model, model), (by_date, date_key), (by_project, project)):
+                sums = axis.get(key)
+                if sums is None:
+                    axis[key] = counts[:4]
+                else:
+                    for i in range(4):
+                        sums[i] += counts[i]
+
+    stats.total_usage = TokenUsage(*total)
+    stats.by_model = {key: TokenUsage(*sums) for key, sums in by_model.items()}
+    stats.by_date = {key: TokenUsage(*sums) for key, sums in by_date.items()}
+    stats.by_project = {key: TokenUsage(*sums) for key, sums in by_project.items()}
+
+    if count:
+        stats.message_count = count
+        stats.date_range = (first, last)
+    return stats
+
+
+def _pool_context():
+    """Multiprocessing context for the parse pool.
+
+    The parser runs on worker threads inside the TUI and daemon, where
+    forking the whole multi-threaded process can deadlock, so workers are
+    started from a clean forkserver (or spawned where that is unavailable).
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _parse_conversation_task(task) -> Tuple[tuple, Optional[int]]:
+    """Parse one (jsonl_file, project, offset) task in a worker process.
+
+    Only the file's totals travel back to the parent, not its messages.
+    """
+    messages, resume_offset = ClaudeDataParser()._parse_file(*task)
+    return _group_messages(messages), resume_offset
 
 
 def main():
@@ -281,10 +633,8 @@ def main():
         for i in range(6, -1, -1):
             date = end_date - timedelta(days=i)
             date_key = date.strftime("%Y-%m-%d")
-            usage = stats.by_date.get(date_key, TokenUsage())
-            if usage.total_tokens > 0:
-                cost = sum(parser.calculate_cost(stats.by_model[m], m)
-                          for m in stats.by_model.keys())
+            usage = stats.by_date.get(date_key)
+            if usage and usage.total_tokens > 0:
                 print(f"   {date_key}: {usage.total_tokens:,} tokens")
 
 
@@ -10,12 +10,15 @@ from textual.reactive import reactive
 from rich.text import Text
 from rich.panel import Panel
 from rich.table import Table
-from datetime import datetime, timedelta, timezone
+from rich.console import Group
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-import json
 import math
 import argparse
+import asyncio
+import functools
 import sys
+import threading
 
 try:
     import pytz
@@ -182,7 +185,133 @@ def utc_date_to_local(date_str: str, source_tz: str = "UTC") -> tuple[str, str]:
 
     except Exception:
         return date_str, source_tz
-from claude_data_parser import TokenUsage
+
+
+@functools.lru_cache(maxsize=64)
+def format_local_timestamp(timestamp: str) -> str:
+    """Format an ISO timestamp in the local timezone ("Unknown" if unparseable).
+
+    Cached, since the same daemon timestamp is shown until its next poll.
+    """
+    try:
+        dt = datetime.fromisoformat(timestamp)
+        # Convert to local timezone for display
+        local_dt = dt.astimezone()
+        return local_dt.strftime("%Y-%m-%d %I:%M:%S %p %Z")
+    except Exception:
+        return "Unknown"
+
+
+# Abbreviated weekday names, indexed by date.weekday()
+WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+@functools.lru_cache(maxsize=64)
+def format_day_usage(date_key: str, tokens: tuple, pricing: tuple) -> tuple:
+    """Compute the costs and header labels of one day in the dot-matrix chart.
+
+    Args:
+        date_key: Date in YYYY-MM-DD format
+        tokens: (input, output, cache_creation, cache_read, total) token counts
+        pricing: Per-token prices for the four token types, in the same order
+
+    Returns:
+        (day_name, costs, labels) where costs is (total, input, output,
+        cache_creation, cache_read) in dollars and labels holds a
+        (tokens_label, cost_label) pair per cost, or None for a token type
+        with no usage. Cached, since past days never change.
+    """
+    day_name = WEEKDAY_NAMES[date.fromisoformat(date_key).weekday()]
+
+    type_costs = [count * price for count, price in zip(tokens, pricing)]
+    total_cost = type_costs[0] + type_costs[1] + type_costs[2] + type_costs[3]
+    costs = (total_cost, *type_costs)
+
+    labels = tuple(
+        (f"{int(count/1000):,}K", f"${cost:.2f}") if count > 0 or i == 0 else None
+        for i, (count, cost) in enumerate(zip((tokens[4], *tokens[:4]), costs))
+    )
+    return day_name, costs, labels
+
+
+# Parsed daemon files: path -> ((st_mtime_ns, st_size), parsed data).
+# Shared by every widget, so refresh ticks that find a file unchanged
+# cost a single stat() instead of a re-read and re-parse.
+_DAEMON_CACHE: dict = {}
+_DAEMON_CACHE_LOCK = threading.Lock()
+
+
+def _load_cached(path: Path, loader):
+    """Return loader(path), reusing the last result while the file is unchanged.
+
+    Raises FileNotFoundError (after dropping any cached entry) if the file is gone.
+    Safe to call from worker threads.
+    """
+    with _DAEMON_CACHE_LOCK:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            _DAEMON_CACHE.pop(path, None)
+            raise
+
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _DAEMON_CACHE.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        data = loader(path)
+        _DAEMON_CACHE[path] = (key, data)
+        return data
+
+
+def _read_last_jsonl_record(path: Path):
+    """Parse the last non-empty line of a JSONL file (None if empty).
+
+    Only the tail of the file is read; the window doubles if a line is longer.
+    """
+    with open(path, 'rb') as f:
+        size = f.seek(0, 2)
+        window = 8192
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            tail = f.read().rstrip()
+            if start == 0 or b'\n' in tail:
+                break
+            window *= 2
+    last_line = tail.rsplit(b'\n', 1)[-1]
+    return json_loads(last_line) if last_line else None
+
+
+def _read_json(path: Path):
+    """Parse a JSON file."""
+    return json_loads(path.read_bytes())
+
+
+# One tracker shared by every widget, so the parser (and its per-file
+# cache) is built once instead of once per widget
+_TRACKER = None
+
+
+def get_tracker() -> ClaudeUsageTracker:
+    """Return the shared ClaudeUsageTracker, creating it on first use."""
+    global _TRACKER
+    if _TRACKER is None:
+        _TRACKER = ClaudeUsageTracker()
+    return _TRACKER
+
+
+# Serializes stats loads from overlapping timer ticks and workers
+_STATS_LOCK = threading.Lock()
+
+
+def _load_stats(tracker: ClaudeUsageTracker):
+    """Get detailed stats; runs in a worker thread, one load at a time."""
+    with _STATS_LOCK:
+        return tracker.get_detailed_stats()
+
+
+from claude_data_parser import TokenUsage, json_loads
 from version import __version__, __title__, __description__
 
 
@@ -191,10 +320,9 @@ class CustomFooter(Static):
 
     def compose(self) -> ComposeResult:
         """Compose footer with left and right content."""
-        from rich.table import Table as RichTable
 
         # Create a table with left and right columns
-        table = RichTable.grid(expand=True)
+        table = Table.grid(expand=True)
         table.add_column(justify="left")
         table.add_column(justify="right")
 
@@ -220,9 +348,14 @@ class SessionLimits(Static):
     DAEMON_DATA_DIR = Path.home() / ".claudeusagetracker"
     RAW_LOG_FILE = DAEMON_DATA_DIR / "raw_usage_log.jsonl"
 
+    # Progress bars are sliced from these instead of being built per bar
+    BAR_LEN = 40
+    _FULL_BAR = "█" * BAR_LEN
+    _EMPTY_BAR = "░" * BAR_LEN
+
     def __init__(self):
         super().__init__()
-        self.tracker = ClaudeUsageTracker()
+        self.tracker = get_tracker()
         self.limits_parser = self.tracker.limits_parser
         # Cache the limits
         self.cached_limits = None
@@ -230,13 +363,8 @@ class SessionLimits(Static):
         # Plan-specific limits (detected from data)
         self.session_token_limit = self.DEFAULT_SESSION_TOKEN_LIMIT
         self.plan_name = "Claude"
-
-    def on_mount(self) -> None:
-        """Set up auto-refresh."""
-        # Refresh immediately on first load
-        self.refresh_data()
-        # Then refresh every 15 seconds
-        self.set_interval(15, self.refresh_data)
+        # Inputs of the panel currently shown, to skip identical re-renders
+        self._last_render_key = None
 
     def _load_latest_daemon_data(self):
         """Load the latest usage data from daemon's raw log file.
@@ -244,69 +372,61 @@ class SessionLimits(Static):
         Returns tuple of (limits_dict, timestamp) or (None, None) if unavailable
         """
         try:
-            if self.RAW_LOG_FILE.exists():
-                # Read the last line of the JSONL file
-                with open(self.RAW_LOG_FILE, 'r') as f:
-                    lines = f.readlines()
-                    if lines:
-                        last_line = lines[-1].strip()
-                        data = json.loads(last_line)
-                        return data, data.get('timestamp')
+            # Last line of the JSONL file (cached until the daemon appends)
+            data = _load_cached(self.RAW_LOG_FILE, _read_last_jsonl_record)
+            if data:
+                return data, data.get('timestamp')
         except Exception as e:
             pass
         return None, None
 
-    def refresh_data(self) -> None:
-        """Refresh session limits from daemon data."""
-        from rich.table import Table as RichTable
-        from rich.console import Group
+    def _bar(self, pct: float) -> str:
+        """Render a BAR_LEN-wide progress bar for a percentage (capped at 100%)."""
+        # Scale before dividing so the fill is a single integer division
+        filled = max(0, min(int(pct * self.BAR_LEN) // 100, self.BAR_LEN))
+        return self._FULL_BAR[:filled] + self._EMPTY_BAR[filled:]
 
-        # Try to load from daemon's stored data first
-        daemon_data, timestamp = self._load_latest_daemon_data()
+    def _redraw(self, daemon_data, timestamp) -> None:
+        """Render session limits from the latest daemon record."""
+
+        # Nothing to redraw if the daemon hasn't logged anything new. Reset
+        # times are converted relative to the current UTC date, so that is
+        # part of the key too.
+        render_key = (daemon_data, datetime.now(timezone.utc).date())
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
 
         if daemon_data and daemon_data.get('session') and daemon_data.get('extra'):
             # Use daemon's cached data
             session_data = daemon_data['session']
             extra_data = daemon_data['extra']
-            plan_data = daemon_data.get('plan')  # May be None for older daemon data
+            plan_data = daemon_data.get('plan') or {}  # May be None for older daemon data
             weekly_data = daemon_data.get('weekly')
             weekly_opus_data = daemon_data.get('weekly_opus')
             weekly_sonnet_data = daemon_data.get('weekly_sonnet')
 
             # Detect plan and set limits
-            if plan_data:
-                self.plan_name = plan_data.get('display_name', 'Claude')
-                self.session_token_limit = plan_data.get('session_token_limit', self.DEFAULT_SESSION_TOKEN_LIMIT)
-            else:
-                self.plan_name = "Claude"
-                self.session_token_limit = self.DEFAULT_SESSION_TOKEN_LIMIT
+            self.plan_name = plan_data.get('display_name', 'Claude')
+            self.session_token_limit = plan_data.get('session_token_limit', self.DEFAULT_SESSION_TOKEN_LIMIT)
 
             # Parse timestamp and convert to local timezone
-            from datetime import datetime
-            try:
-                dt = datetime.fromisoformat(timestamp)
-                # Convert to local timezone for display
-                local_dt = dt.astimezone()
-                time_str = local_dt.strftime("%Y-%m-%d %I:%M:%S %p %Z")
-            except:
-                time_str = "Unknown"
+            time_str = format_local_timestamp(timestamp)
 
             output = []
 
             # Current Session with timestamp on same line
-            first_line_table = RichTable.grid(expand=True)
+            first_line_table = Table.grid(expand=True)
             first_line_table.add_column(justify="left")
             first_line_table.add_column(justify="right")
             first_line_table.add_row("[bold cyan]Current session (5-hour)[/bold cyan]", f"[dim]Last Updated: {time_str}[/dim]")
             output.append(first_line_table)
 
-            bar_len = 40
             session_pct = session_data['percent_used']
-            filled = min(int((session_pct / 100) * bar_len), bar_len)  # Cap at 100%
-            bar = "█" * filled + "░" * (bar_len - filled)
+            bar = self._bar(session_pct)
 
             # Calculate token counts
-            session_used = int((session_pct / 100) * self.session_token_limit)
+            session_used = int(session_pct * self.session_token_limit) // 100
 
             output.append(f"[cyan]{bar}[/cyan] {session_pct:.0f}% used")
             output.append(f"[dim]{session_used:,} / {self.session_token_limit:,} tokens (estimated)[/dim]")
@@ -323,8 +443,7 @@ class SessionLimits(Static):
                 output.append("[bold magenta]Weekly limit (overall)[/bold magenta]")
 
                 weekly_pct = weekly_data['percent_used']
-                filled = min(int((weekly_pct / 100) * bar_len), bar_len)  # Cap at 100%
-                bar = "█" * filled + "░" * (bar_len - filled)
+                bar = self._bar(weekly_pct)
 
                 output.append(f"[magenta]{bar}[/magenta] {weekly_pct:.0f}% used")
                 # Convert weekly reset time to local timezone
@@ -339,8 +458,7 @@ class SessionLimits(Static):
                 output.append("[bold blue]Weekly Sonnet limit[/bold blue]")
 
                 weekly_pct = weekly_sonnet_data['percent_used']
-                filled = min(int((weekly_pct / 100) * bar_len), bar_len)  # Cap at 100%
-                bar = "█" * filled + "░" * (bar_len - filled)
+                bar = self._bar(weekly_pct)
 
                 output.append(f"[blue]{bar}[/blue] {weekly_pct:.0f}% used")
                 # Convert weekly Sonnet reset time to local timezone
@@ -355,8 +473,7 @@ class SessionLimits(Static):
                 output.append("[bold green]Weekly Opus limit[/bold green]")
 
                 weekly_pct = weekly_opus_data['percent_used']
-                filled = min(int((weekly_pct / 100) * bar_len), bar_len)  # Cap at 100%
-                bar = "█" * filled + "░" * (bar_len - filled)
+                bar = self._bar(weekly_pct)
 
                 output.append(f"[green]{bar}[/green] {weekly_pct:.0f}% used")
                 # Convert weekly Opus reset time to local timezone
@@ -371,10 +488,8 @@ class SessionLimits(Static):
             # Extra Usage
             output.append("[bold yellow]Extra usage[/bold yellow]")
 
-            bar_len = 40
             extra_pct = extra_data['percent_used']
-            filled = min(int((extra_pct / 100) * bar_len), bar_len)  # Cap at 100%
-            bar = "█" * filled + "░" * (bar_len - filled)
+            bar = self._bar(extra_pct)
 
             output.append(f"[yellow]{bar}[/yellow] {extra_pct:.0f}% used")
             output.append(f"[dim]${extra_data['amount_spent']:.2f} / ${extra_data['amount_limit']:.2f} spent[/dim]")
@@ -420,18 +535,17 @@ class TokenBreakdown(Static):
 
     def __init__(self):
         super().__init__()
-        self.tracker = ClaudeUsageTracker()
-
-    def on_mount(self) -> None:
-        """Set up auto-refresh."""
-        # Refresh immediately on first load
-        self.refresh_data()
-        # Then refresh every 15 seconds
-        self.set_interval(15, self.refresh_data)
-
-    def refresh_data(self) -> None:
-        """Refresh token data."""
-        stats = self.tracker.get_detailed_stats()
+        # Token totals currently shown, to skip identical re-renders
+        self._last_render_key = None
+
+    def _redraw(self, stats) -> None:
+        """Render the token totals."""
+        usage = stats.total_usage
+        render_key = (stats.message_count, usage.input_tokens, usage.output_tokens,
+                      usage.cache_creation_tokens, usage.cache_read_tokens)
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
 
         if stats.message_count == 0:
             self.update("No data")
@@ -472,18 +586,28 @@ class DailyUsageChart(Static):
         "cache_read": 0.30 / 1_000_000
     }
 
+    # Bar sections, bottom to top: (token key, pricing key, background color)
+    TOKEN_SECTIONS = (
+        ('input_tokens', 'input', 'bright_blue'),
+        ('output_tokens', 'output', 'bright_green'),
+        ('cache_creation_tokens', 'cache_creation', 'yellow'),
+        ('cache_read_tokens', 'cache_read', 'bright_magenta'),
+    )
+
+    # One box per day, each BOX_WIDTH wide (wider to fit totals: 13×7=91 chars)
+    BOX_WIDTH = 13
+    CHART_DAYS = 7
+    TOP_BORDERS = " ".join(["┌" + "─" * BOX_WIDTH + "┐"] * CHART_DAYS)
+    BOTTOM_BORDERS = " ".join(["└" + "─" * BOX_WIDTH + "┘"] * CHART_DAYS)
+    EMPTY_BOX = "│" + " " * BOX_WIDTH + "│"
+
     def __init__(self):
         super().__init__()
-        self.tracker = ClaudeUsageTracker()
+        self.tracker = get_tracker()
         self.limits_parser = self.tracker.limits_parser
-        self.history_offset = 0  # For scrolling through history
-
-    def on_mount(self) -> None:
-        """Set up auto-refresh."""
-        # Refresh immediately on first load
-        self.refresh_data()
-        # Then refresh every 15 seconds
-        self.set_interval(15, self.refresh_data)
+        # Stats and per-day token counts currently shown, to skip identical re-renders
+        self._last_stats = None
+        self._last_render_key = None
 
     def _get_token_breakdown_by_type(self, stats, dates):
         """Get detailed token breakdown by type for each date.
@@ -527,9 +651,8 @@ class DailyUsageChart(Static):
         {'session_tokens': X, 'extra_tokens': Y, 'total_tokens': Z}
         """
         try:
-            if self.DAILY_SUMMARY_FILE.exists():
-                with open(self.DAILY_SUMMARY_FILE, 'r') as f:
-                    return json.load(f)
+            # Cached until the daemon rewrites the file
+            return _load_cached(self.DAILY_SUMMARY_FILE, _read_json)
         except Exception as e:
             # Fallback to empty dict if daemon data unavailable
             pass
@@ -571,18 +694,24 @@ class DailyUsageChart(Static):
 
         return breakdown
 
-    def refresh_data(self) -> None:
-        """Refresh daily usage chart with token type breakdown."""
-        stats = self.tracker.get_detailed_stats()
+    def _redraw(self, stats) -> None:
+        """Render the stacked bar chart for the last CHART_DAYS days."""
+        # The parser hands back the same stats object while no conversation
+        # file has changed, and everything below derives from it alone
+        if stats is self._last_stats:
+            return
+        self._last_stats = stats
 
         if stats.message_count == 0:
+            self._last_render_key = None
             self.update("No data")
             return
 
         # Get last 7 days
-        last_days = self.tracker.get_last_n_days(stats, 7)
+        last_days = self.tracker.get_last_n_days(stats, self.CHART_DAYS)
 
         if not last_days:
+            self._last_render_key = None
             self.update("No data")
             return
 
@@ -592,8 +721,14 @@ class DailyUsageChart(Static):
         # Get token breakdown by type for each day
         token_breakdown = self._get_token_breakdown_by_type(stats, dates)
 
+        # The chart depends only on the per-day counts; skip identical re-renders
+        render_key = tuple((date, tuple(token_breakdown[date].values())) for date in dates)
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+
         # Build chart - height will vary per bar based on actual token counts
-        box_width = 13   # Wider to fit totals: 13×7=91 chars
+        box_width = self.BOX_WIDTH
         MIN_BAR_HEIGHT = 3   # Minimum height for smallest bar
         MAX_BAR_HEIGHT = 30  # Cap to fit on screen
 
@@ -629,8 +764,7 @@ class DailyUsageChart(Static):
         lines.append("")
 
         # Top borders
-        top_row = "┌" + ("─" * box_width) + "┐"
-        lines.append(" ".join([top_row] * 7))
+        lines.append(self.TOP_BORDERS)
 
         # Dates (centered)
         date_row_parts = []
@@ -640,124 +774,81 @@ class DailyUsageChart(Static):
             date_row_parts.append(f"│{centered_date}│")
         lines.append(" ".join(date_row_parts))
 
-        # Vertical stacked bars with labels
-        for row in range(max_bar_height, 0, -1):
-            bar_row_parts = []
-
-            for date_key in dates:
-                tokens = token_breakdown[date_key]
-                total = tokens['total_tokens']
-
-                if total == 0:
-                    bar_row_parts.append(f"│{' ' * box_width}│")
-                    continue
-
-                # Calculate total bar height based on total tokens (linear scale)
-                total_bar_height = total * scale_factor
-
-                # Use LOG scale for proportions WITHIN the bar so all sections are visible
-                # Token order (bottom to top, smallest to largest typically):
-                # 1. Input (blue) - smallest, ~10-80K
-                # 2. Output (green) - small, ~6-116K
-                # 3. Cache creation (yellow) - medium, ~274K-7M
-                # 4. Cache read (magenta) - largest, ~3.8M-77M
-                log_input = math.log10(tokens['input_tokens'] + 1)
-                log_output = math.log10(tokens['output_tokens'] + 1)
-                log_cache_create = math.log10(tokens['cache_creation_tokens'] + 1)
-                log_cache_read = math.log10(tokens['cache_read_tokens'] + 1)
-                log_total = log_input + log_output + log_cache_create + log_cache_read
-
-                if log_total > 0:
-                    # Divide the bar height proportionally based on log of token counts
-                    # But ensure minimum 1 char height for each non-zero token type
-                    MIN_SECTION = 1.0
-
-                    input_section = max(MIN_SECTION if tokens['input_tokens'] > 0 else 0, (log_input / log_total) * total_bar_height)
-                    output_section = max(MIN_SECTION if tokens['output_tokens'] > 0 else 0, (log_output / log_total) * total_bar_height)
-                    cache_create_section = max(MIN_SECTION if tokens['cache_creation_tokens'] > 0 else 0, (log_cache_create / log_total) * total_bar_height)
-                    cache_read_section = max(MIN_SECTION if tokens['cache_read_tokens'] > 0 else 0, (log_cache_read / log_total) * total_bar_height)
-
-                    # Stack them
-                    input_height = input_section
-                    output_height = input_height + output_section
-                    cache_create_height = output_height + cache_create_section
-                    cache_read_height = cache_create_height + cache_read_section
-                else:
-                    input_height = output_height = cache_create_height = cache_read_height = 0
-
-                # Determine which section this row belongs to
-                content = ""
-                if row <= input_height:
-                    # Input tokens (bright blue background, black text)
-                    tokens_k = int(tokens['input_tokens'] / 1000)
-                    cost = tokens['input_tokens'] * self.PRICING['input']
-                    if tokens_k > 0 and row == int(input_height / 2) + 1:
-                        # Show label in middle of this section
-                        label = f"{tokens_k:,}K/${cost:.2f}"
-                        if len(label) <= box_width:
-                            content = f"[black on bright_blue]{label.center(box_width)}[/]"
-                        else:
-                            content = f"[black on bright_blue]{' ' * box_width}[/]"
-                    else:
-                        content = f"[black on bright_blue]{' ' * box_width}[/]"
-                elif row <= output_height:
-                    # Output tokens (bright green background, black text)
-                    tokens_k = int(tokens['output_tokens'] / 1000)
-                    cost = tokens['output_tokens'] * self.PRICING['output']
-                    section_middle = int((input_height + output_height) / 2) + 1
-                    if tokens_k > 0 and row == section_middle:
-                        label = f"{tokens_k:,}K/${cost:.2f}"
-                        if len(label) <= box_width:
-                            content = f"[black on bright_green]{label.center(box_width)}[/]"
-                        else:
-                            content = f"[black on bright_green]{' ' * box_width}[/]"
-                    else:
-                        content = f"[black on bright_green]{' ' * box_width}[/]"
-                elif row <= cache_create_height:
-                    # Cache creation tokens (yellow background, black text)
-                    tokens_k = int(tokens['cache_creation_tokens'] / 1000)
-                    cost = tokens['cache_creation_tokens'] * self.PRICING['cache_creation']
-                    section_middle = int((output_height + cache_create_height) / 2) + 1
-                    if tokens_k > 0 and row == section_middle:
-                        label = f"{tokens_k:,}K/${cost:.2f}"
-                        if len(label) <= box_width:
-                            content = f"[black on yellow]{label.center(box_width)}[/]"
-                        else:
-                            content = f"[black on yellow]{' ' * box_width}[/]"
-                    else:
-                        content = f"[black on yellow]{' ' * box_width}[/]"
-                elif row <= cache_read_height:
-                    # Cache read tokens (bright magenta background, black text)
-                    tokens_k = int(tokens['cache_read_tokens'] / 1000)
-                    cost = tokens['cache_read_tokens'] * self.PRICING['cache_read']
-                    section_middle = int((cache_create_height + cache_read_height) / 2) + 1
-                    if tokens_k > 0 and row == section_middle:
-                        label = f"{tokens_k:,}K/${cost:.2f}"
-                        if len(label) <= box_width:
-                            content = f"[black on bright_magenta]{label.center(box_width)}[/]"
-                        else:
-                            content = f"[black on bright_magenta]{' ' * box_width}[/]"
-                    else:
-                        content = f"[black on bright_magenta]{' ' * box_width}[/]"
+        # Work out each day's column once as a row -> rendered box table
+        # (index 0 unused), so the row loop below is a plain lookup
+        MIN_SECTION = 1.0
+        blank = " " * box_width
+        fill_boxes = {
+            color: f"│[black on {color}]{blank}[/]│"
+            for _, _, color in self.TOKEN_SECTIONS
+        }
+        columns = []
+        for date_key in dates:
+            tokens = token_breakdown[date_key]
+            total = tokens['total_tokens']
+            column = [self.EMPTY_BOX] * (max_bar_height + 1)  # Empty space above bars
+            columns.append(column)
+
+            if total == 0:
+                continue
+
+            # Calculate total bar height based on total tokens (linear scale)
+            total_bar_height = total * scale_factor
+
+            # Use LOG scale for proportions WITHIN the bar so all sections are visible
+            # Token order (bottom to top, smallest to largest typically):
+            # 1. Input (blue) - smallest, ~10-80K
+            # 2. Output (green) - small, ~6-116K
+            # 3. Cache creation (yellow) - medium, ~274K-7M
+            # 4. Cache read (magenta) - largest, ~3.8M-77M
+            logs = []
+            log_total = 0
+            for key, _, _ in self.TOKEN_SECTIONS:
+                log_value = math.log10(tokens[key] + 1)
+                logs.append(log_value)
+                log_total += log_value
+            if log_total <= 0:
+                continue
+
+            # Divide the bar height proportionally based on log of token counts,
+            # but ensure minimum 1 char height for each non-zero token type,
+            # and stack the sections on top of each other. Sections run bottom
+            # to top, so each one fills the rows up to its top not yet taken.
+            bottom = 0
+            row = 1
+            for (key, price_key, color), log_value in zip(self.TOKEN_SECTIONS, logs):
+                count = tokens[key]
+                section = max(MIN_SECTION if count > 0 else 0, (log_value / log_total) * total_bar_height)
+                top = bottom + section
+
+                # Show label in middle of this section if it fits
+                fill_box = fill_boxes[color]
+                tokens_k = int(count / 1000)
+                label = f"{tokens_k:,}K/${count * self.PRICING[price_key]:.2f}"
+                if tokens_k > 0 and len(label) <= box_width:
+                    label_box = f"│[black on {color}]{label.center(box_width)}[/]│"
                 else:
-                    # Empty space above bars
-                    content = " " * box_width
+                    label_box = fill_box
 
-                bar_row_parts.append(f"│{content}│")
+                label_row = int((bottom + top) / 2) + 1
+                while row <= max_bar_height and row <= top:
+                    column[row] = label_box if row == label_row else fill_box
+                    row += 1
+                bottom = top
 
-            lines.append(" ".join(bar_row_parts))
+        # Vertical stacked bars with labels
+        for row in range(max_bar_height, 0, -1):
+            lines.append(" ".join([column[row] for column in columns]))
 
         # Total tokens at bottom
         count_row_parts = []
         for date_key in dates:
-            total = token_breakdown[date_key]['total_tokens']
+            tokens = token_breakdown[date_key]
+            total = tokens['total_tokens']
             if total > 0:
-                total_cost = (
-                    token_breakdown[date_key]['input_tokens'] * self.PRICING['input'] +
-                    token_breakdown[date_key]['output_tokens'] * self.PRICING['output'] +
-                    token_breakdown[date_key]['cache_creation_tokens'] * self.PRICING['cache_creation'] +
-                    token_breakdown[date_key]['cache_read_tokens'] * self.PRICING['cache_read']
-                )
+                total_cost = 0
+                for key, price_key, _ in self.TOKEN_SECTIONS:
+                    total_cost += tokens[key] * self.PRICING[price_key]
                 label = f"{int(total/1000):,}K/${total_cost:.2f}"
                 count_row_parts.append(f"│[bold]{label.center(box_width)}[/bold]│")
             else:
@@ -765,8 +856,7 @@ class DailyUsageChart(Static):
         lines.append(" ".join(count_row_parts))
 
         # Bottom borders
-        bottom_row = "└" + ("─" * box_width) + "┘"
-        lines.append(" ".join([bottom_row] * 7))
+        lines.append(self.BOTTOM_BORDERS)
 
         panel = Panel(
             "\n".join(lines),
@@ -787,6 +877,8 @@ class DailyUsageChartDots(Static):
         "cache_creation": 3.75 / 1_000_000,
         "cache_read": 0.30 / 1_000_000
     }
+    # Same prices as a tuple, in the token order used by format_day_usage
+    PRICING_RATES = tuple(PRICING.values())
 
     # Token-based scale
     TOKENS_PER_SUBDOT = 10_000  # 10K tokens per subdot (1/8 of full character)
@@ -796,6 +888,16 @@ class DailyUsageChartDots(Static):
     COST_PER_SUBDOT = 0.01  # $0.01 per subdot
     COST_PER_FULL_DOT = 0.08  # $0.08 per full Braille character (⣿ = 8 subdots)
 
+    # Static chart text, built once rather than on every refresh
+    LEGEND = "[bold cyan]Legend:[/bold cyan] [bright_blue]⣿[/bright_blue]=Input  [bright_green]⣿[/bright_green]=Output  [yellow]⣿[/yellow]=Cache Create  [bright_magenta]⣿[/bright_magenta]=Cache Read"
+    MODE_LINES = {
+        'tokens': f"[dim]Mode: TOKENS | ⣿ = {TOKENS_PER_FULL_DOT/1000:.0f}K tokens (each subdot = {TOKENS_PER_SUBDOT/1000:.0f}K) | Press 'd' to switch to cost mode[/dim]",
+        'cost': f"[dim]Mode: COST | ⣿ = ${COST_PER_FULL_DOT:.2f} (each subdot = ${COST_PER_SUBDOT:.2f}) | Press 'd' to switch to token mode[/dim]",
+    }
+
+    # Header label colors: total, then input, output, cache creation, cache read
+    HEADER_COLORS = ("white", "bright_blue", "bright_green", "yellow", "bright_magenta")
+
     # Braille patterns for partial dots (0/8 to 8/8 filled)
     BRAILLE_PATTERNS = [
         " ",   # 0/8 - empty
@@ -811,44 +913,43 @@ class DailyUsageChartDots(Static):
 
     def __init__(self):
         super().__init__()
-        self.tracker = ClaudeUsageTracker()
+        self.tracker = get_tracker()
         self.display_mode = 'tokens'  # 'tokens' or 'cost'
         self.last_refresh = None
         self.days_visible = 2  # Default to 2 days
         self.days_offset = 0  # How many days back we've scrolled
-
-    def on_mount(self) -> None:
-        """Set up auto-refresh."""
-        self.refresh_data()
-        self.set_interval(15, self.refresh_data)
+        self._stats = None  # Last loaded stats; view changes re-render from these
+        # Day rows currently shown and the inputs they were rendered from
+        self._last_render_key = None
+        self._last_day_lines = []
 
     def toggle_display_mode(self) -> None:
         """Toggle between token and cost display modes."""
         self.display_mode = 'cost' if self.display_mode == 'tokens' else 'tokens'
-        self.refresh_data()
+        self._redraw()
 
     def scroll_days_forward(self) -> None:
         """Scroll to show older dates."""
         self.days_offset += 1
-        self.refresh_data()
+        self._redraw()
 
     def scroll_days_backward(self) -> None:
         """Scroll to show newer dates."""
         if self.days_offset > 0:
             self.days_offset -= 1
-            self.refresh_data()
+            self._redraw()
 
     def increase_visible_days(self) -> None:
         """Increase number of visible days (max 5)."""
         if self.days_visible < 5:
             self.days_visible += 1
-            self.refresh_data()
+            self._redraw()
 
     def decrease_visible_days(self) -> None:
         """Decrease number of visible days (min 1)."""
         if self.days_visible > 1:
             self.days_visible -= 1
-            self.refresh_data()
+            self._redraw()
 
     def _render_bar(self, tokens: int, cost: float, color: str, max_width: int = 60) -> str:
         """Render a horizontal bar using Braille characters with wrapping.
@@ -895,74 +996,129 @@ class DailyUsageChartDots(Static):
 
         # Wrap if needed
         if len(bar) > max_width:
-            wrapped_lines = []
-            for i in range(0, len(bar), max_width):
-                wrapped_lines.append(f"[{color}]{bar[i:i+max_width]}[/{color}]")
-            return "\n               ".join(wrapped_lines)  # 15 spaces to align with label
-        else:
-            return f"[{color}]{bar}[/{color}]"
+            return "\n               ".join([  # 15 spaces to align with label
+                f"[{color}]{bar[i:i + max_width]}[/{color}]"
+                for i in range(0, len(bar), max_width)
+            ])
+        return f"[{color}]{bar}[/{color}]"
 
-    def _render_merged_bar(self, token_breakdown: dict, cost_breakdown: dict, max_width: int = 100) -> str:
+    def _render_merged_bar(self, token_counts: tuple, cost_breakdown: dict) -> str:
         """Render a single merged bar with all token types flowing together.
 
         Args:
-            token_breakdown: Dict with 'input_tokens', 'output_tokens', etc.
+            token_counts: (input, output, cache_creation, cache_read, total) token counts
             cost_breakdown: Dict with 'input_cost', 'output_cost', etc.
-            max_width: Maximum width per line before wrapping
 
         Returns:
             Merged bar with color transitions
         """
         # Render each section without wrapping first
         input_bar = self._render_bar(
-            token_breakdown['input_tokens'],
+            token_counts[0],
             cost_breakdown['input_cost'],
             'bright_blue',
             max_width=999999
         )
         output_bar = self._render_bar(
-            token_breakdown['output_tokens'],
+            token_counts[1],
             cost_breakdown['output_cost'],
             'bright_green',
             max_width=999999
         )
         cache_create_bar = self._render_bar(
-            token_breakdown['cache_creation_tokens'],
+            token_counts[2],
             cost_breakdown['cache_create_cost'],
             'yellow',
             max_width=999999
         )
         cache_read_bar = self._render_bar(
-            token_breakdown['cache_read_tokens'],
+            token_counts[3],
             cost_breakdown['cache_read_cost'],
             'bright_magenta',
             max_width=999999
         )
 
-        # Combine all bars
-        merged = input_bar + output_bar + cache_create_bar + cache_read_bar
+        # Combine all bars. Wrapping across color tags is left to Textual,
+        # so there is no need to measure the visible length here.
+        return input_bar + output_bar + cache_create_bar + cache_read_bar
 
-        # Now wrap the merged bar
-        if not merged:
-            return ""
+    def _render_day_lines(self, dates: list, token_breakdown: dict) -> list:
+        """Render the mode/controls info and one header plus bar per day."""
+        lines = []
 
-        # Strip color tags to count actual characters
-        import re
-        plain_merged = re.sub(r'\[/?[^\]]+\]', '', merged)
+        # Display mode info
+        lines.append(self.MODE_LINES[self.display_mode])
 
-        if len(plain_merged) <= max_width:
-            return merged
-        else:
-            # Need to wrap - this is complex with color tags, so we'll keep it simple
-            # and just return the merged bar (Textual will handle wrapping)
-            return merged
+        # View controls info
+        lines.append(f"[dim]Showing {self.days_visible} day(s) | ↑/↓: Scroll | +/-: Adjust days[/dim]")
+        lines.append("")
 
-    def refresh_data(self) -> None:
-        """Refresh daily usage chart with horizontal dot-matrix bars."""
-        from datetime import datetime
+        # First pass: look up each day's (cached) values and determine max widths
+        day_data = []
+        token_widths = [0] * 5
+        cost_widths = [0] * 5
+
+        for date_key in dates:
+            token_counts = token_breakdown[date_key]
+            if token_counts[4] == 0:
+                day_data.append((date_key, None))
+                continue
+
+            day_info = format_day_usage(date_key, token_counts, self.PRICING_RATES)
+            day_data.append((date_key, day_info))
+
+            for i, label in enumerate(day_info[2]):
+                if label:
+                    token_widths[i] = max(token_widths[i], len(label[0]))
+                    cost_widths[i] = max(cost_widths[i], len(label[1]))
+
+        # Second pass: render with consistent widths
+        for date_key, day_info in day_data:
+            if day_info is None:
+                lines.append(f"[bold white]{date_key}[/bold white] | [dim]No data[/dim]")
+                lines.append("")
+                continue
+
+            day_name, costs, labels = day_info
+
+            # Build header with dynamically calculated widths
+            header_parts = [f"[bold white]{day_name:<3} {date_key}[/bold white]"]
+            for i, (label, color) in enumerate(zip(labels, self.HEADER_COLORS)):
+                if label:
+                    prefix = "Total: " if i == 0 else ""
+                    header_parts.append(f"[{color}]{prefix}{label[0]:>{token_widths[i]}} / {label[1]:>{cost_widths[i]}}[/{color}]")
+
+            lines.append(" | ".join(header_parts))
+
+            # Create cost breakdown dict
+            cost_breakdown = {
+                'input_cost': costs[1],
+                'output_cost': costs[2],
+                'cache_create_cost': costs[3],
+                'cache_read_cost': costs[4],
+                'total_cost': costs[0]
+            }
+
+            # Single merged bar
+            merged_bar = self._render_merged_bar(token_breakdown[date_key], cost_breakdown)
+            if merged_bar:
+                lines.append(merged_bar)
+
+            lines.append("")  # Blank line between days
+
+        return lines
+
+    def show_stats(self, stats) -> None:
+        """Keep freshly loaded stats and render the visible days from them."""
+        self._stats = stats
         self.last_refresh = datetime.now()
+        self._redraw()
 
-        stats = self.tracker.get_detailed_stats()
+    def _redraw(self) -> None:
+        """Render the visible days from the last loaded stats."""
+        stats = self._stats
+        if stats is None:
+            return
 
         if stats.message_count == 0:
             self.update("No data")
@@ -976,188 +1132,60 @@ class DailyUsageChartDots(Static):
             return
 
         # Get data in reverse order (newest to oldest)
-        all_dates = list(reversed(list(all_days.keys())))
+        all_dates = list(all_days)[::-1]
 
         # Apply offset and limit based on days_visible
         start_idx = self.days_offset
         end_idx = start_idx + self.days_visible
         dates = all_dates[start_idx:end_idx]
 
-        # Create last_days dict with only the visible dates
-        last_days = {date: all_days[date] for date in dates if date in all_days}
-
-        # Get token breakdown by type for each day
+        # Get token counts by type for each day, as
+        # (input, output, cache_creation, cache_read, total) tuples
         token_breakdown = {}
         for date in dates:
-            if date in stats.by_date:
-                usage = stats.by_date[date]
-                token_breakdown[date] = {
-                    'input_tokens': usage.input_tokens,
-                    'output_tokens': usage.output_tokens,
-                    'cache_creation_tokens': usage.cache_creation_tokens,
-                    'cache_read_tokens': usage.cache_read_tokens,
-                    'total_tokens': usage.total_tokens
-                }
+            usage = stats.by_date.get(date)
+            if usage is not None:
+                token_breakdown[date] = (
+                    usage.input_tokens,
+                    usage.output_tokens,
+                    usage.cache_creation_tokens,
+                    usage.cache_read_tokens,
+                    usage.total_tokens
+                )
             else:
-                token_breakdown[date] = {
-                    'input_tokens': 0,
-                    'output_tokens': 0,
-                    'cache_creation_tokens': 0,
-                    'cache_read_tokens': 0,
-                    'total_tokens': 0
-                }
+                token_breakdown[date] = (0, 0, 0, 0, 0)
 
         # Build horizontal bar chart
-        from rich.table import Table as RichTable
-        from rich.console import Group
 
         lines = []
 
         # Legend with timestamp on same line (in local timezone)
         refresh_time = self.last_refresh.astimezone().strftime("%Y-%m-%d %I:%M:%S %p %Z") if self.last_refresh else "Never"
-        first_line_table = RichTable.grid(expand=True)
+        first_line_table = Table.grid(expand=True)
         first_line_table.add_column(justify="left")
         first_line_table.add_column(justify="right")
         first_line_table.add_row(
-            "[bold cyan]Legend:[/bold cyan] [bright_blue]⣿[/bright_blue]=Input  [bright_green]⣿[/bright_green]=Output  [yellow]⣿[/yellow]=Cache Create  [bright_magenta]⣿[/bright_magenta]=Cache Read",
+            self.LEGEND,
             f"[dim]Last Updated: {refresh_time}[/dim]"
         )
         lines.append(first_line_table)
 
-        # Display mode info
-        if self.display_mode == 'tokens':
-            lines.append(f"[dim]Mode: TOKENS | ⣿ = {self.TOKENS_PER_FULL_DOT/1000:.0f}K tokens (each subdot = {self.TOKENS_PER_SUBDOT/1000:.0f}K) | Press 'd' to switch to cost mode[/dim]")
-        else:
-            lines.append(f"[dim]Mode: COST | ⣿ = ${self.COST_PER_FULL_DOT:.2f} (each subdot = ${self.COST_PER_SUBDOT:.2f}) | Press 'd' to switch to token mode[/dim]")
-
-        # View controls info
-        lines.append(f"[dim]Showing {self.days_visible} day(s) | ↑/↓: Scroll | +/-: Adjust days[/dim]")
-        lines.append("")
-
-        # First pass: calculate all values and determine max widths
-        day_data = []
-        max_widths = {
-            'total_tokens': 0, 'total_cost': 0,
-            'input_tokens': 0, 'input_cost': 0,
-            'output_tokens': 0, 'output_cost': 0,
-            'cache_create_tokens': 0, 'cache_create_cost': 0,
-            'cache_read_tokens': 0, 'cache_read_cost': 0
-        }
-
-        for date_key in dates:
-            tokens = token_breakdown[date_key]
-            total = tokens['total_tokens']
-
-            if total == 0:
-                day_data.append({'date_key': date_key, 'total': 0})
-                continue
-
-            # Parse date
-            from datetime import datetime
-            date_obj = datetime.strptime(date_key, "%Y-%m-%d")
-            day_name = date_obj.strftime("%a")
-
-            # Calculate costs
-            total_cost = (
-                tokens['input_tokens'] * self.PRICING['input'] +
-                tokens['output_tokens'] * self.PRICING['output'] +
-                tokens['cache_creation_tokens'] * self.PRICING['cache_creation'] +
-                tokens['cache_read_tokens'] * self.PRICING['cache_read']
-            )
-            input_cost = tokens['input_tokens'] * self.PRICING['input']
-            output_cost = tokens['output_tokens'] * self.PRICING['output']
-            cache_create_cost = tokens['cache_creation_tokens'] * self.PRICING['cache_creation']
-            cache_read_cost = tokens['cache_read_tokens'] * self.PRICING['cache_read']
-
-            # Store data
-            day_info = {
-                'date_key': date_key,
-                'day_name': day_name,
-                'total': total,
-                'tokens': tokens,
-                'total_cost': total_cost,
-                'input_cost': input_cost,
-                'output_cost': output_cost,
-                'cache_create_cost': cache_create_cost,
-                'cache_read_cost': cache_read_cost
-            }
-            day_data.append(day_info)
-
-            # Calculate widths for each field
-            max_widths['total_tokens'] = max(max_widths['total_tokens'], len(f"{int(total/1000):,}K"))
-            max_widths['total_cost'] = max(max_widths['total_cost'], len(f"${total_cost:.2f}"))
-
-            if tokens['input_tokens'] > 0:
-                max_widths['input_tokens'] = max(max_widths['input_tokens'], len(f"{int(tokens['input_tokens']/1000):,}K"))
-                max_widths['input_cost'] = max(max_widths['input_cost'], len(f"${input_cost:.2f}"))
-
-            if tokens['output_tokens'] > 0:
-                max_widths['output_tokens'] = max(max_widths['output_tokens'], len(f"{int(tokens['output_tokens']/1000):,}K"))
-                max_widths['output_cost'] = max(max_widths['output_cost'], len(f"${output_cost:.2f}"))
-
-            if tokens['cache_creation_tokens'] > 0:
-                max_widths['cache_create_tokens'] = max(max_widths['cache_create_tokens'], len(f"{int(tokens['cache_creation_tokens']/1000):,}K"))
-                max_widths['cache_create_cost'] = max(max_widths['cache_create_cost'], len(f"${cache_create_cost:.2f}"))
-
-            if tokens['cache_read_tokens'] > 0:
-                max_widths['cache_read_tokens'] = max(max_widths['cache_read_tokens'], len(f"{int(tokens['cache_read_tokens']/1000):,}K"))
-                max_widths['cache_read_cost'] = max(max_widths['cache_read_cost'], len(f"${cache_read_cost:.2f}"))
-
-        # Second pass: render with consistent widths
-        for day_info in day_data:
-            if day_info['total'] == 0:
-                lines.append(f"[bold white]{day_info['date_key']}[/bold white] | [dim]No data[/dim]")
-                lines.append("")
-                continue
-
-            # Extract precomputed values
-            date_key = day_info['date_key']
-            day_name = day_info['day_name']
-            total = day_info['total']
-            tokens = day_info['tokens']
-            total_cost = day_info['total_cost']
-            input_cost = day_info['input_cost']
-            output_cost = day_info['output_cost']
-            cache_create_cost = day_info['cache_create_cost']
-            cache_read_cost = day_info['cache_read_cost']
-
-            # Build header with dynamically calculated widths
-            header_parts = [
-                f"[bold white]{day_name:<3} {date_key}[/bold white]",
-                f"[white]Total: {f'{int(total/1000):,}K':>{max_widths['total_tokens']}} / {f'${total_cost:.2f}':>{max_widths['total_cost']}}[/white]"
+        # The day rows depend only on the view settings and per-day counts,
+        # so they are rebuilt only when one of those changes; the header
+        # above still refreshes its timestamp on every tick. Their markup is
+        # parsed into Text once here rather than on every repaint.
+        render_key = (
+            self.display_mode, self.days_visible, self.days_offset,
+            tuple(token_breakdown.items())
+        )
+        if render_key != self._last_render_key:
+            self._last_day_lines = [
+                Text.from_markup(line) for line in self._render_day_lines(dates, token_breakdown)
             ]
+            self._last_render_key = render_key
+        lines.extend(self._last_day_lines)
 
-            if tokens['input_tokens'] > 0:
-                header_parts.append(f"[bright_blue]{f'{int(tokens['input_tokens']/1000):,}K':>{max_widths['input_tokens']}} / {f'${input_cost:.2f}':>{max_widths['input_cost']}}[/bright_blue]")
-
-            if tokens['output_tokens'] > 0:
-                header_parts.append(f"[bright_green]{f'{int(tokens['output_tokens']/1000):,}K':>{max_widths['output_tokens']}} / {f'${output_cost:.2f}':>{max_widths['output_cost']}}[/bright_green]")
-
-            if tokens['cache_creation_tokens'] > 0:
-                header_parts.append(f"[yellow]{f'{int(tokens['cache_creation_tokens']/1000):,}K':>{max_widths['cache_create_tokens']}} / {f'${cache_create_cost:.2f}':>{max_widths['cache_create_cost']}}[/yellow]")
-
-            if tokens['cache_read_tokens'] > 0:
-                header_parts.append(f"[bright_magenta]{f'{int(tokens['cache_read_tokens']/1000):,}K':>{max_widths['cache_read_tokens']}} / {f'${cache_read_cost:.2f}':>{max_widths['cache_read_cost']}}[/bright_magenta]")
-
-            lines.append(" | ".join(header_parts))
-
-            # Create cost breakdown dict
-            cost_breakdown = {
-                'input_cost': input_cost,
-                'output_cost': output_cost,
-                'cache_create_cost': cache_create_cost,
-                'cache_read_cost': cache_read_cost,
-                'total_cost': total_cost
-            }
-
-            # Single merged bar
-            merged_bar = self._render_merged_bar(tokens, cost_breakdown)
-            if merged_bar:
-                lines.append(merged_bar)
-
-            lines.append("")  # Blank line between days
-
-        # Create content group (first item is table, rest are strings)
+        # Create content group (first item is table, rest are day rows)
         content = Group(*lines)
 
         panel = Panel(
@@ -1241,6 +1269,34 @@ class ClaudeUsageTUI(App):
 
         yield CustomFooter()
 
+    def on_mount(self) -> None:
+        """Load initial data, then refresh all data widgets every 15 seconds."""
+        self.run_worker(self.refresh_widgets(), group="refresh")
+        self.set_interval(15, self.refresh_widgets)
+
+    async def refresh_widgets(self) -> None:
+        """Load fresh data once and repaint every data widget in one pass."""
+        session_widgets = list(self.query(SessionLimits))
+        stats_widgets = list(self.query("TokenBreakdown, DailyUsageChart"))
+        dots_widgets = list(self.query(DailyUsageChartDots))
+
+        # Load outside the batch: Textual holds repaints while a batch is
+        # open, and key-driven redraws must not wait on parsing
+        load_daemon = (session_widgets[0]._load_latest_daemon_data
+                       if session_widgets else lambda: (None, None))
+        stats, (daemon_data, timestamp) = await asyncio.gather(
+            asyncio.to_thread(_load_stats, get_tracker()),
+            asyncio.to_thread(load_daemon),
+        )
+
+        with self.batch_update():
+            for widget in session_widgets:
+                widget._redraw(daemon_data, timestamp)
+            for widget in stats_widgets:
+                widget._redraw(stats)
+            for widget in dots_widgets:
+                widget.show_stats(stats)
+
     def action_toggle_chart(self) -> None:
         """Toggle visibility of the daily usage chart."""
         middle_row = self.query_one("#middle_row")
@@ -20,21 +20,31 @@ v2.0.0 Changes:
 
 import os
 import sys
-import time
-import json
 import signal
+import threading
 import argparse
+import functools
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any
 import logging
 
+import pytz
+
 # Import our existing parsers
 from usage_limits_parser import UsageLimitsParser
-from claude_data_parser import ClaudeDataParser, TokenUsage
+from claude_data_parser import (
+    ClaudeDataParser, TokenUsage, json_indented, json_line, json_loads,
+)
 from version import __version__, __title__
 
 
+@functools.lru_cache(maxsize=16)
+def _get_timezone(name: str):
+    """Return the pytz timezone for name, cached across polls."""
+    return pytz.timezone(name)
+
+
 class ClaudeUsageDaemon:
     """Background daemon for collecting Claude usage data."""
 
@@ -47,9 +57,19 @@ class ClaudeUsageDaemon:
     def __init__(self, debug=False):
         self.limits_parser = UsageLimitsParser()
         self.data_parser = ClaudeDataParser()
-        self.running = True
+        # Set by the signal handler; waiting on it lets shutdown cut a sleep short
+        self._stop_event = threading.Event()
         self.last_extra_usage = None
         self.last_session_reset = None
+        # Last usage summary and its serialized form, reused while no JSONL changes
+        self._jsonl_stats = None
+        self._jsonl_data = None
+        # Daily summary kept in memory between polls (loaded on first update),
+        # and the (date, entry) last written to DAILY_SUMMARY_FILE
+        self._summary = None
+        self._written_entry = None
+        # Raw log file descriptor, kept open across polls
+        self._raw_log_fd = None
         self.setup_logging(debug=debug)
         self.ensure_data_directory()
 
@@ -87,7 +107,7 @@ class ClaudeUsageDaemon:
     def signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully."""
         self.logger.info(f"Received signal {signum}, shutting down...")
-        self.running = False
+        self._stop_event.set()
 
     def calculate_session_start_time(self, reset_time_str: str, timezone_str: str) -> Optional[datetime]:
         """Calculate when the current session started based on reset time.
@@ -100,14 +120,11 @@ class ClaudeUsageDaemon:
             datetime of session start (5 hours before reset)
         """
         try:
-            from datetime import datetime
-            import pytz
-
             # Parse reset time (e.g., "2pm" -> 14:00)
             reset_hour = self._parse_time_to_hour(reset_time_str)
 
             # Get timezone
-            tz = pytz.timezone(timezone_str)
+            tz = _get_timezone(timezone_str)
             now = datetime.now(tz)
 
             # Create reset datetime for today
@@ -131,13 +148,18 @@ class ClaudeUsageDaemon:
         """Parse time string like '2pm' or '7am' to hour (24-hour format)."""
         time_str = time_str.lower().strip()
 
-        # Extract number
-        hour = int(''.join(filter(str.isdigit, time_str)))
+        # Split off the AM/PM suffix
+        suffix = time_str[-2:]
+        if suffix in ('am', 'pm'):
+            time_str = time_str[:-2]
+
+        # Hour is the number before any ":MM" minutes
+        hour = int(time_str.partition(':')[0])
 
         # Check AM/PM
-        if 'pm' in time_str and hour != 12:
+        if suffix == 'pm' and hour != 12:
             hour += 12
-        elif 'am' in time_str and hour == 12:
+        elif suffix == 'am' and hour == 12:
             hour = 0
 
         return hour
@@ -145,11 +167,16 @@ class ClaudeUsageDaemon:
     def collect_jsonl_data(self) -> Dict[str, Any]:
         """Collect token usage from JSONL files.
 
+        Only appended JSONL data is parsed each poll (see ClaudeDataParser's
+        parse cache), and the same summary is returned while nothing changed.
+
         Returns:
             Dictionary with token counts by date
         """
         try:
             stats = self.data_parser.get_usage_summary()
+            if stats is self._jsonl_stats:
+                return self._jsonl_data
 
             # Convert by_date to regular dict for JSON serialization
             by_date = {}
@@ -162,7 +189,8 @@ class ClaudeUsageDaemon:
                     "total_tokens": usage.total_tokens
                 }
 
-            return {
+            self._jsonl_stats = stats
+            self._jsonl_data = {
                 "total_messages": stats.message_count,
                 "by_date": by_date,
                 "date_range": [
@@ -170,6 +198,7 @@ class ClaudeUsageDaemon:
                     stats.date_range[1].isoformat() if stats.date_range[1] else None
                 ]
             }
+            return self._jsonl_data
         except Exception as e:
             self.logger.error(f"Error collecting JSONL data: {e}")
             return {"by_date": {}}
@@ -185,7 +214,7 @@ class ClaudeUsageDaemon:
             limits = self.limits_parser.get_current_limits()
 
             # Log what we got from parser (debug level)
-            self.logger.debug(f"Parser returned session={limits.session}, extra={limits.extra}, plan={limits.plan}")
+            self.logger.debug("Parser returned session=%s, extra=%s, plan=%s", limits.session, limits.extra, limits.plan)
 
             # Build data record with ALL captured fields
             now = datetime.now()
@@ -268,11 +297,39 @@ class ClaudeUsageDaemon:
     def append_raw_log(self, data: Dict[str, Any]):
         """Append data to raw JSONL log (one JSON object per line)."""
         try:
-            with open(self.RAW_LOG_FILE, 'a') as f:
-                f.write(json.dumps(data) + '\n')
+            # Reopen if the log was deleted since the last poll
+            if self._raw_log_fd is not None and os.fstat(self._raw_log_fd).st_nlink == 0:
+                self.close_raw_log()
+            if self._raw_log_fd is None:
+                self._raw_log_fd = os.open(self.RAW_LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            # A single O_APPEND write keeps each record on its own line
+            os.write(self._raw_log_fd, json_line(data))
         except Exception as e:
             self.logger.error(f"Error writing raw log: {e}")
 
+    def close_raw_log(self):
+        """Close the raw JSONL log if it is open."""
+        if self._raw_log_fd is not None:
+            os.close(self._raw_log_fd)
+            self._raw_log_fd = None
+
+    def _average_token_cost(self, day_tokens: Dict[str, Any]) -> float:
+        """Average cost per token of one day's JSONL token counts.
+
+        Uses Sonnet pricing for the day's mix of input, output and cache
+        tokens (the daemon's JSONL data is not broken down by model).
+        """
+        total = day_tokens.get("total_tokens", 0)
+        if not total:
+            return 0.0
+        usage = TokenUsage(
+            input_tokens=day_tokens.get("input_tokens", 0),
+            output_tokens=day_tokens.get("output_tokens", 0),
+            cache_creation_tokens=day_tokens.get("cache_creation_tokens", 0),
+            cache_read_tokens=day_tokens.get("cache_read_tokens", 0)
+        )
+        return self.data_parser.calculate_cost(usage, "claude-sonnet-4-5") / total
+
     def update_daily_summary(self, data: Dict[str, Any]):
         """Update daily summary with new data.
 
@@ -282,15 +339,17 @@ class ClaudeUsageDaemon:
         - Session count changes (from /usage)
         """
         try:
-            # Load existing summary
-            if self.DAILY_SUMMARY_FILE.exists():
-                with open(self.DAILY_SUMMARY_FILE, 'r') as f:
-                    summary = json.load(f)
-            else:
-                summary = {}
+            # Load existing summary once; the daemon is its only writer
+            if self._summary is None:
+                if self.DAILY_SUMMARY_FILE.exists():
+                    self._summary = json_loads(self.DAILY_SUMMARY_FILE.read_bytes())
+                else:
+                    self._summary = {}
+            summary = self._summary
 
-            # Get today's date
-            today = datetime.now().date().isoformat()
+            # Today's date, taken from the record's local ISO timestamp so the
+            # entry always matches the poll's own clock reading
+            today = data["timestamp"][:10]
 
             # Initialize today's entry if needed
             if today not in summary:
@@ -318,9 +377,10 @@ class ClaudeUsageDaemon:
                     if self.last_extra_usage is not None and data.get("extra"):
                         current_extra = data["extra"]["amount_spent"]
                         if current_extra > 0:
-                            # Estimate extra tokens based on cost
-                            # Average cost per token ~$0.000003 (rough estimate)
-                            estimated_extra_tokens = int(current_extra / 0.000003)
+                            # Estimate extra tokens based on cost, at the
+                            # average per-token cost of today's token mix
+                            rate = self._average_token_cost(today_jsonl)
+                            estimated_extra_tokens = int(current_extra / rate) if rate else 0
                             summary[today]["extra_tokens"] = min(estimated_extra_tokens, total)
                             summary[today]["session_tokens"] = total - summary[today]["extra_tokens"]
                         else:
@@ -340,7 +400,7 @@ class ClaudeUsageDaemon:
                     if delta > 0:
                         # Extra usage increased
                         summary[today]["extra_cost"] = current_extra
-                        self.logger.info(f"Extra usage increased by ${delta:.2f} to ${current_extra:.2f}")
+                        self.logger.info("Extra usage increased by $%.2f to $%.2f", delta, current_extra)
 
                 self.last_extra_usage = current_extra
 
@@ -351,15 +411,26 @@ class ClaudeUsageDaemon:
                 if self.last_session_reset is not None and current_reset != self.last_session_reset:
                     # Session reset detected
                     summary[today]["sessions_count"] += 1
-                    self.logger.info(f"Session reset detected: {self.last_session_reset} -> {current_reset}")
+                    self.logger.info("Session reset detected: %s -> %s", self.last_session_reset, current_reset)
 
                 self.last_session_reset = current_reset
 
-            summary[today]["last_updated"] = data["timestamp"]
-
-            # Write updated summary
-            with open(self.DAILY_SUMMARY_FILE, 'w') as f:
-                json.dump(summary, f, indent=2)
+            # Only rewrite the file when one of today's figures changed, so
+            # last_updated records when the entry last changed rather than
+            # the most recent poll
+            entry = summary[today]
+            if self._written_entry is not None:
+                written_date, written = self._written_entry
+                if written_date == today and written == entry:
+                    return
+            entry["last_updated"] = data["timestamp"]
+
+            # Write updated summary to a temp file and rename it into place,
+            # so the TUI never reads a partially written file
+            tmp_file = self.DAILY_SUMMARY_FILE.with_name(f"{self.DAILY_SUMMARY_FILE.name}.tmp")
+            tmp_file.write_bytes(json_indented(summary))
+            os.replace(tmp_file, self.DAILY_SUMMARY_FILE)
+            self._written_entry = (today, dict(entry))
 
         except Exception as e:
             self.logger.error(f"Error updating daily summary: {e}")
@@ -378,10 +449,10 @@ class ClaudeUsageDaemon:
 
         poll_count = 0
 
-        while self.running:
+        while not self._stop_event.is_set():
             try:
                 poll_count += 1
-                self.logger.info(f"Poll #{poll_count}")
+                self.logger.info("Poll #%d", poll_count)
 
                 # Collect /usage limits data
                 limits_data = self.collect_usage_data()
@@ -402,28 +473,26 @@ class ClaudeUsageDaemon:
 
                     # Log summary
                     if limits_data.get("session"):
-                        self.logger.info(f"  Session: {limits_data['session']['percent_used']}% used, resets {limits_data['session']['reset_time']}")
+                        self.logger.info("  Session: %s%% used, resets %s", limits_data['session']['percent_used'], limits_data['session']['reset_time'])
                     if limits_data.get("extra"):
-                        self.logger.info(f"  Extra: ${limits_data['extra']['amount_spent']:.2f} / ${limits_data['extra']['amount_limit']:.2f}")
+                        self.logger.info("  Extra: $%.2f / $%.2f", limits_data['extra']['amount_spent'], limits_data['extra']['amount_limit'])
 
                     # Log JSONL stats
-                    today = datetime.now().date().isoformat()
+                    today = limits_data["timestamp"][:10]
                     today_tokens = jsonl_data.get("by_date", {}).get(today, {}).get("total_tokens", 0)
                     if today_tokens > 0:
                         self.logger.info(f"  Tokens today (JSONL): {today_tokens:,}")
                 else:
                     self.logger.warning("Failed to collect usage data")
 
-                # Sleep until next poll
-                time.sleep(self.POLL_INTERVAL)
+                # Sleep until next poll (returns early on shutdown)
+                self._stop_event.wait(self.POLL_INTERVAL)
 
-            except KeyboardInterrupt:
-                self.logger.info("Keyboard interrupt received")
-                break
             except Exception as e:
                 self.logger.error(f"Error in main loop: {e}", exc_info=True)
-                time.sleep(self.POLL_INTERVAL)
+                self._stop_event.wait(self.POLL_INTERVAL)
 
+        self.close_raw_log()
         self.logger.info("Daemon shutdown complete")
 
 
@@ -13,19 +13,55 @@ Key advantages over pexpect approach:
 - Industry standard (used by all major Claude usage trackers)
 """
 
+import atexit
+import functools
 import json
 import requests
 import logging
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+from claude_data_parser import DATACLASS_SLOTS, json_loads, parse_timestamp
 
 # Module-level logger
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _format_reset_time(resets_at: datetime) -> str:
+    """Format a reset time as e.g. "3pm" or "2:59pm"."""
+    # Built from the fields directly; cheaper than strftime("%-I:%M%p")
+    hour12 = resets_at.hour % 12 or 12
+    suffix = "am" if resets_at.hour < 12 else "pm"
+    if resets_at.minute:
+        return f"{hour12}:{resets_at.minute:02d}{suffix}"
+    return f"{hour12}{suffix}"
+
+
+def _format_reset_datetime(resets_at: datetime) -> str:
+    """Format a reset date and time as e.g. "2026-01-10 02:00pm"."""
+    hour12 = resets_at.hour % 12 or 12
+    suffix = "am" if resets_at.hour < 12 else "pm"
+    return f"{resets_at.date().isoformat()} {hour12:02d}:{resets_at.minute:02d}{suffix}"
+
+
+@functools.lru_cache(maxsize=16)
+def _weekly_reset_time(resets_at_str: str) -> str:
+    """Format a weekly limit's resets_at timestamp (returned as-is if malformed).
+
+    Cached, since the weekly variants usually share one reset timestamp.
+    """
+    try:
+        return _format_reset_datetime(parse_timestamp(resets_at_str))
+    except (AttributeError, TypeError, ValueError):
+        return resets_at_str
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SessionLimit:
     """Current session usage limit."""
     percent_used: float
@@ -33,7 +69,7 @@ class SessionLimit:
     reset_timezone: str
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class WeeklyLimit:
     """Weekly usage limit (Max plans only)."""
     percent_used: float
@@ -42,7 +78,7 @@ class WeeklyLimit:
     limit_type: str  # "overall", "opus", "sonnet", "oauth_apps"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ExtraUsage:
     """Extra usage (overage) information."""
     percent_used: float
@@ -52,7 +88,7 @@ class ExtraUsage:
     reset_timezone: str
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PlanInfo:
     """Claude subscription plan information."""
     has_max: bool
@@ -63,7 +99,7 @@ class PlanInfo:
     session_token_limit: int  # e.g., 88000 for Max 5x, 44000 for Pro
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class UsageLimits:
     """Overall usage limits from Claude plan."""
     session: Optional[SessionLimit] = None
@@ -74,6 +110,22 @@ class UsageLimits:
     weekly_sonnet: Optional[WeeklyLimit] = None
 
 
+def _parse_weekly(data: Dict[str, Any], key: str, limit_type: str) -> Optional[WeeklyLimit]:
+    """Parse one weekly limit entry from the usage response, if present."""
+    weekly_data = data.get(key)
+    if not weekly_data:
+        return None
+
+    limit = WeeklyLimit(
+        percent_used=float(weekly_data.get("utilization", 0.0)),
+        reset_time=_weekly_reset_time(weekly_data.get("resets_at", "")),
+        reset_timezone="UTC",
+        limit_type=limit_type
+    )
+    logger.debug("Parsed weekly %s: %s%%, resets %s", limit_type, limit.percent_used, limit.reset_time)
+    return limit
+
+
 class OAuthUsageAPI:
     """
     Fetch Claude usage data using OAuth API.
@@ -89,6 +141,48 @@ class OAuthUsageAPI:
     # Request timeout in seconds
     TIMEOUT = 10
 
+    # Rate limit tier substrings (matched against the lower-cased tier, in
+    # order) mapped to their display name and session token limit
+    TIER_PLANS = (
+        ("max_20x", "Claude Max 20x", 220000),
+        ("max_5x", "Claude Max 5x", 88000),
+    )
+
+    # Headers sent with every request (the token is added per request)
+    HEADERS = {
+        "Content-Type": "application/json",
+        "anthropic-beta": "oauth-2025-04-20",
+        "User-Agent": "claude-code/2.0.37"
+    }
+
+    # Shared HTTP session, created on first use, so consecutive requests
+    # reuse the pooled TLS connection instead of reconnecting each time.
+    # The lock stops the concurrent profile/usage fetches from each
+    # creating one on the first call.
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    # Seconds a successful get_current_limits() result is reused, so callers
+    # polling faster than the server updates don't repeat the requests
+    CACHE_TTL = 5.0
+    _cached_limits: Optional[UsageLimits] = None
+    _cached_at = 0.0
+
+    # ((st_mtime_ns, st_size), token) of the last credentials file read;
+    # Claude Code rewrites the file when it refreshes the token
+    _token_cache: Optional[tuple] = None
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Return the shared HTTP session, creating it on first use."""
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                session.headers.update(cls.HEADERS)
+                atexit.register(session.close)
+                cls._session = session
+            return cls._session
+
     @classmethod
     def load_oauth_token(cls) -> Optional[str]:
         """
@@ -98,12 +192,19 @@ class OAuthUsageAPI:
             Access token string (starts with sk-ant-oat01-) or None if not found
         """
         try:
-            if not cls.CREDENTIALS_FILE.exists():
-                logger.error(f"Credentials file not found: {cls.CREDENTIALS_FILE}")
+            try:
+                st = cls.CREDENTIALS_FILE.stat()
+            except FileNotFoundError:
+                logger.error("Credentials file not found: %s", cls.CREDENTIALS_FILE)
                 return None
 
-            with open(cls.CREDENTIALS_FILE, 'r') as f:
-                creds = json.load(f)
+            # Reuse the token while the credentials file is unchanged
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = cls._token_cache
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+            creds = json_loads(cls.CREDENTIALS_FILE.read_bytes())
 
             token = creds.get("claudeAiOauth", {}).get("accessToken")
 
@@ -111,14 +212,15 @@ class OAuthUsageAPI:
                 logger.error("No OAuth access token found in credentials file")
                 return None
 
-            logger.debug(f"Successfully loaded OAuth token (starts with {token[:20]}...)")
+            logger.debug("Successfully loaded OAuth token (starts with %s...)", token[:20])
+            cls._token_cache = (signature, token)
             return token
 
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse credentials file: {e}")
+            logger.error("Failed to parse credentials file: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Error loading OAuth token: {e}")
+            logger.error("Error loading OAuth token: %s", e)
             return None
 
     @classmethod
@@ -145,56 +247,11 @@ class OAuthUsageAPI:
 
             Returns None if request fails.
         """
-        # Load OAuth token
-        token = cls.load_oauth_token()
-        if not token:
-            return None
-
-        # Prepare headers
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "anthropic-beta": "oauth-2025-04-20",
-            "User-Agent": "claude-code/2.0.37"
-        }
-
-        logger.debug(f"Making OAuth API request to {cls.API_URL}")
-
-        try:
-            response = requests.get(
-                cls.API_URL,
-                headers=headers,
-                timeout=cls.TIMEOUT
-            )
-
-            # Log response status
-            logger.debug(f"API response status: {response.status_code}")
-
-            # Raise exception for bad status codes
-            response.raise_for_status()
-
-            # Parse JSON response
-            data = response.json()
-            logger.debug(f"Successfully fetched usage data: {json.dumps(data, indent=2)}")
-
-            return data
-
-        except requests.exceptions.Timeout:
-            logger.error(f"Request timed out after {cls.TIMEOUT} seconds")
-            return None
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error: {e}")
-            logger.error(f"Response body: {e.response.text if e.response else 'N/A'}")
-            return None
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error fetching usage data: {e}")
-            return None
+        data = cls._get_json(cls.API_URL, "usage")
+        # Pretty-printing the response is only worth it when debug is on
+        if data is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Usage data: %s", json.dumps(data, indent=2))
+        return data
 
     @classmethod
     def get_user_profile(cls) -> Optional[Dict[str, Any]]:
@@ -205,50 +262,65 @@ class OAuthUsageAPI:
             Dictionary with profile data including plan type, tier, etc.
             Returns None if request fails.
         """
+        return cls._get_json(cls.PROFILE_URL, "profile")
+
+    @classmethod
+    def _get_json(cls, url: str, name: str) -> Optional[Dict[str, Any]]:
+        """
+        GET an OAuth API endpoint and decode its JSON response.
+
+        Args:
+            url: Endpoint URL
+            name: Short endpoint name for log messages (e.g., "usage")
+
+        Returns:
+            Decoded response, or None if the request fails.
+        """
         # Load OAuth token
         token = cls.load_oauth_token()
         if not token:
             return None
 
-        # Prepare headers
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "anthropic-beta": "oauth-2025-04-20",
-            "User-Agent": "claude-code/2.0.37"
-        }
+        # Static headers are preset on the session
+        headers = {"Authorization": f"Bearer {token}"}
 
-        logger.debug(f"Making OAuth profile request to {cls.PROFILE_URL}")
+        logger.debug("Making OAuth %s request to %s", name, url)
 
         try:
-            response = requests.get(
-                cls.PROFILE_URL,
+            response = cls._get_session().get(
+                url,
                 headers=headers,
                 timeout=cls.TIMEOUT
             )
 
-            logger.debug(f"Profile API response status: {response.status_code}")
+            # Log response status
+            logger.debug("%s API response status: %s", name.capitalize(), response.status_code)
+
+            # Raise exception for bad status codes
             response.raise_for_status()
 
-            data = response.json()
-            logger.debug(f"Successfully fetched profile data")
+            # Parse JSON response
+            data = json_loads(response.content)
+            logger.debug("Successfully fetched %s data", name)
 
             return data
 
         except requests.exceptions.Timeout:
-            logger.error(f"Profile request timed out after {cls.TIMEOUT} seconds")
+            logger.error("%s request timed out after %s seconds", name.capitalize(), cls.TIMEOUT)
             return None
         except requests.exceptions.HTTPError as e:
-            logger.error(f"Profile HTTP error: {e}")
+            logger.error("%s HTTP error: %s", name.capitalize(), e)
+            # A Response is falsy for error statuses, so compare against None
+            logger.error("Response body: %s", e.response.text if e.response is not None else 'N/A')
             return None
         except requests.exceptions.RequestException as e:
-            logger.error(f"Profile request failed: {e}")
+            logger.error("%s request failed: %s", name.capitalize(), e)
             return None
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse profile JSON: {e}")
+            logger.error("Failed to parse %s JSON response: %s", name, e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error fetching profile: {e}")
+            logger.error("Unexpected error fetching %s data: %s", name, e)
             return None
 
     @classmethod
@@ -272,12 +344,10 @@ class OAuthUsageAPI:
             org_type = org.get("organization_type", "unknown")
 
             # Determine display name and session limit based on tier
-            if "max_20x" in tier.lower():
-                display_name = "Claude Max 20x"
-                session_limit = 220000
-            elif "max_5x" in tier.lower():
-                display_name = "Claude Max 5x"
-                session_limit = 88000
+            tier_lower = tier.lower()
+            tier_plan = next((plan for plan in cls.TIER_PLANS if plan[0] in tier_lower), None)
+            if tier_plan:
+                _, display_name, session_limit = tier_plan
             elif has_max:
                 display_name = "Claude Max"
                 session_limit = 88000  # Default to 5x if unclear
@@ -297,12 +367,12 @@ class OAuthUsageAPI:
                 session_token_limit=session_limit
             )
 
-            logger.debug(f"Parsed plan: {display_name} (tier: {tier}, session limit: {session_limit:,} tokens)")
+            logger.debug("Parsed plan: %s (tier: %s, session limit: %s tokens)", display_name, tier, f"{session_limit:,}")
 
             return plan
 
         except Exception as e:
-            logger.error(f"Error parsing plan info: {e}")
+            logger.error("Error parsing plan info: %s", e)
             return None
 
     @classmethod
@@ -316,7 +386,8 @@ class OAuthUsageAPI:
         Returns:
             UsageLimits object with parsed session and extra usage data
         """
-        limits = UsageLimits()
+        session = None
+        extra_usage = None
 
         # Parse session data (5-hour rolling window)
         if data.get("five_hour"):
@@ -325,21 +396,20 @@ class OAuthUsageAPI:
             # Extract reset time from ISO 8601 timestamp
             resets_at_str = five_hour.get("resets_at", "")
             try:
-                resets_at = datetime.fromisoformat(resets_at_str.replace('Z', '+00:00'))
+                resets_at = parse_timestamp(resets_at_str)
                 # Format as "3pm" or "2:59pm"
-                reset_time = resets_at.strftime("%-I:%M%p").lower()
-                if reset_time.endswith(":00am") or reset_time.endswith(":00pm"):
-                    reset_time = resets_at.strftime("%-I%p").lower()
-            except:
+                reset_time = _format_reset_time(resets_at)
+            except (AttributeError, TypeError, ValueError):
+                # Missing or malformed timestamp: show it as received
                 reset_time = resets_at_str
 
-            limits.session = SessionLimit(
+            session = SessionLimit(
                 percent_used=float(five_hour.get("utilization", 0.0)),
                 reset_time=reset_time,
                 reset_timezone="UTC"
             )
 
-            logger.debug(f"Parsed session: {limits.session.percent_used}%, resets {limits.session.reset_time}")
+            logger.debug("Parsed session: %s%%, resets %s", session.percent_used, session.reset_time)
 
         # Parse extra usage data
         if data.get("extra_usage"):
@@ -352,7 +422,7 @@ class OAuthUsageAPI:
             # Calculate utilization percentage
             utilization = extra.get("utilization", 0.0)
 
-            limits.extra = ExtraUsage(
+            extra_usage = ExtraUsage(
                 percent_used=float(utilization),
                 amount_spent=used_dollars,
                 amount_limit=limit_dollars,
@@ -360,37 +430,17 @@ class OAuthUsageAPI:
                 reset_timezone="UTC"
             )
 
-            logger.debug(f"Parsed extra: {limits.extra.percent_used}%, ${limits.extra.amount_spent:.2f}/${limits.extra.amount_limit:.2f}")
-
-        # Include plan information
-        limits.plan = plan
-
-        # Parse weekly limits (Max plans only)
-        def parse_weekly(key: str, limit_type: str) -> Optional[WeeklyLimit]:
-            if data.get(key):
-                weekly_data = data[key]
-                resets_at_str = weekly_data.get("resets_at", "")
-                try:
-                    resets_at = datetime.fromisoformat(resets_at_str.replace('Z', '+00:00'))
-                    reset_time = resets_at.strftime("%Y-%m-%d %I:%M%p").lower()
-                except:
-                    reset_time = resets_at_str
-
-                limit = WeeklyLimit(
-                    percent_used=float(weekly_data.get("utilization", 0.0)),
-                    reset_time=reset_time,
-                    reset_timezone="UTC",
-                    limit_type=limit_type
-                )
-                logger.debug(f"Parsed weekly {limit_type}: {limit.percent_used}%, resets {limit.reset_time}")
-                return limit
-            return None
-
-        limits.weekly = parse_weekly("seven_day", "overall")
-        limits.weekly_opus = parse_weekly("seven_day_opus", "opus")
-        limits.weekly_sonnet = parse_weekly("seven_day_sonnet", "sonnet")
+            logger.debug("Parsed extra: %s%%, $%.2f/$%.2f", extra_usage.percent_used, extra_usage.amount_spent, extra_usage.amount_limit)
 
-        return limits
+        # Weekly limits are only present on Max plans
+        return UsageLimits(
+            session=session,
+            extra=extra_usage,
+            plan=plan,
+            weekly=_parse_weekly(data, "seven_day", "overall"),
+            weekly_opus=_parse_weekly(data, "seven_day_opus", "opus"),
+            weekly_sonnet=_parse_weekly(data, "seven_day_sonnet", "sonnet"),
+        )
 
     @classmethod
     def get_current_limits(cls) -> UsageLimits:
@@ -404,28 +454,35 @@ class OAuthUsageAPI:
             plan information, and weekly limits (for Max plans),
             or empty UsageLimits if request fails.
         """
+        now = time.monotonic()
+        if cls._cached_limits is not None and now - cls._cached_at < cls.CACHE_TTL:
+            return cls._cached_limits
+
         logger.info("Fetching usage data and plan info via OAuth API")
 
-        # Fetch profile/plan data
-        profile_data = cls.get_user_profile()
+        # Fetch profile/plan data and usage data concurrently; the two
+        # endpoints are independent, so this costs one round trip, not two
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            profile_future = executor.submit(cls.get_user_profile)
+            usage_future = executor.submit(cls.get_usage_data)
+            profile_data = profile_future.result()
+            data = usage_future.result()
+
         plan = None
         if profile_data:
             plan = cls.parse_plan_info(profile_data)
 
-        # Fetch usage data from API
-        data = cls.get_usage_data()
-
         if not data:
             logger.warning("Failed to fetch usage data from OAuth API")
             # Return empty limits but include plan if we got it
-            limits = UsageLimits()
-            limits.plan = plan
-            return limits
+            return UsageLimits(plan=plan)
 
         # Parse and return (includes plan info)
         limits = cls.parse_usage_limits(data, plan)
 
         logger.info("Successfully retrieved usage limits and plan info")
+        cls._cached_limits = limits
+        cls._cached_at = now
         return limits
 
 
@@ -436,6 +493,8 @@ def main():
         level=logging.DEBUG,
         format='%(asctime)s - %(levelname)s - %(message)s'
     )
+    # Keep urllib3's per-connection debug chatter out of the test output
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
 
     print("=" * 70)
     print("OAuth Usage API Test (v2.0.0 with Plan Detection)")
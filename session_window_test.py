@@ -16,14 +16,20 @@ Arguments:
 
 import argparse
 import json
+import re
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List
 import sys
 
-# Import our existing parser
+# Import our existing parsers
 from usage_limits_parser import UsageLimitsParser
+from claude_data_parser import json_line
+
+
+# Session reset time as shown by the parser, e.g. "3pm" or "2:59pm"
+_RESET_TIME_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*([ap]m)?', re.IGNORECASE)
 
 
 class SessionWindowTest:
@@ -86,23 +92,28 @@ class SessionWindowTest:
         """Calculate when the next reset will occur based on reset time string.
 
         Args:
-            reset_time_str: e.g., "2pm" or "7pm"
+            reset_time_str: e.g., "2pm", "7pm" or "2:59pm"
             current_time: Current datetime
 
         Returns:
             Datetime of next reset
         """
-        # Parse reset hour
-        reset_time_lower = reset_time_str.lower().strip()
-        hour = int(''.join(filter(str.isdigit, reset_time_lower)))
+        # Parse reset hour and optional minutes
+        match = _RESET_TIME_RE.search(reset_time_str)
+        if not match:
+            raise ValueError(f"Unrecognized reset time: {reset_time_str!r}")
 
-        if 'pm' in reset_time_lower and hour != 12:
+        hour = int(match.group(1))
+        minute = int(match.group(2) or 0)
+        suffix = (match.group(3) or "").lower()
+
+        if suffix == 'pm' and hour != 12:
             hour += 12
-        elif 'am' in reset_time_lower and hour == 12:
+        elif suffix == 'am' and hour == 12:
             hour = 0
 
         # Calculate next reset
-        reset_today = current_time.replace(hour=hour, minute=0, second=0, microsecond=0)
+        reset_today = current_time.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
         if current_time < reset_today:
             return reset_today
@@ -118,16 +129,22 @@ class SessionWindowTest:
         if not self.test_data:
             return {"error": "No test data collected"}
 
+        # Parse each poll timestamp once; reused for intervals and the conclusion
+        stamps = [datetime.fromisoformat(entry["poll_timestamp"]) for entry in self.test_data]
+
         reset_times = []
-        for entry in self.test_data:
+        reset_stamps = []
+        for entry, stamp in zip(self.test_data, stamps):
             if entry.get("session") and entry["session"].get("reset_time"):
                 reset_times.append({
                     "timestamp": entry["poll_timestamp"],
                     "reset_time": entry["session"]["reset_time"]
                 })
+                reset_stamps.append(stamp)
 
         # Detect changes in reset time
         changes = []
+        change_stamps = []
         prev_reset = None
 
         for i, rt in enumerate(reset_times):
@@ -138,15 +155,14 @@ class SessionWindowTest:
                     "from": prev_reset,
                     "to": rt["reset_time"]
                 })
+                change_stamps.append(reset_stamps[i])
             prev_reset = rt["reset_time"]
 
         # Calculate time between polls
-        poll_intervals = []
-        for i in range(1, len(self.test_data)):
-            t1 = datetime.fromisoformat(self.test_data[i-1]["poll_timestamp"])
-            t2 = datetime.fromisoformat(self.test_data[i]["poll_timestamp"])
-            interval_minutes = (t2 - t1).total_seconds() / 60
-            poll_intervals.append(interval_minutes)
+        poll_intervals = [
+            (t2 - t1).total_seconds() / 60
+            for t1, t2 in zip(stamps, stamps[1:])
+        ]
 
         avg_interval = sum(poll_intervals) / len(poll_intervals) if poll_intervals else 0
 
@@ -160,14 +176,16 @@ class SessionWindowTest:
             "reset_changes": changes,
             "start_time": self.test_data[0]["poll_timestamp"] if self.test_data else None,
             "end_time": self.test_data[-1]["poll_timestamp"] if self.test_data else None,
-            "conclusion": self._generate_conclusion(changes, len(reset_times))
+            "conclusion": self._generate_conclusion(changes, change_stamps, len(reset_times))
         }
 
-    def _generate_conclusion(self, changes: List[Dict], total_polls: int) -> str:
+    def _generate_conclusion(self, changes: List[Dict], change_stamps: List[datetime],
+                             total_polls: int) -> str:
         """Generate conclusion based on observed data.
 
         Args:
             changes: List of detected reset time changes
+            change_stamps: Parsed poll time of each change
             total_polls: Total number of successful polls
 
         Returns:
@@ -185,9 +203,7 @@ class SessionWindowTest:
 
         # Calculate time between changes
         if len(changes) > 0:
-            first_change = datetime.fromisoformat(changes[0]["timestamp"])
-            last_change = datetime.fromisoformat(changes[-1]["timestamp"]) if len(changes) > 1 else first_change
-            time_span = (last_change - first_change).total_seconds() / 3600  # hours
+            time_span = (change_stamps[-1] - change_stamps[0]).total_seconds() / 3600  # hours
 
             return (
                 f"Detected {len(changes)} reset time change(s) over {time_span:.1f} hours. "
@@ -230,8 +246,11 @@ class SessionWindowTest:
         print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*70}\n")
 
-        # Calculate end time and total polls
+        # Calculate end time and total polls. The loop itself is scheduled on
+        # the monotonic clock so wall-clock steps cannot stretch or cut the run
         end_time = datetime.now() + timedelta(hours=self.duration_hours)
+        deadline = time.monotonic() + self.duration_hours * 3600
+        interval_seconds = self.poll_interval_minutes * 60
         total_polls = int((self.duration_hours * 60) / self.poll_interval_minutes)
 
         print(f"Will run until: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -242,8 +261,14 @@ class SessionWindowTest:
 
         poll_count = 0
 
+        # Keep the log open for the whole run; it is unbuffered, so each
+        # poll still reaches the file as soon as it is written
+        log_fh = open(self.log_file, 'ab', buffering=0)
+
+        next_wake = time.monotonic()
+
         try:
-            while datetime.now() < end_time:
+            while time.monotonic() < deadline:
                 poll_count += 1
 
                 # Poll /usage
@@ -251,33 +276,36 @@ class SessionWindowTest:
                 self.test_data.append(data)
 
                 # Log to file (append-only JSONL)
-                with open(self.log_file, 'a') as f:
-                    f.write(json.dumps(data) + '\n')
+                log_fh.write(json_line(data))
 
                 # Print status
                 self.print_status(poll_count, total_polls, data)
 
-                # Calculate time to next poll
-                next_poll = datetime.now() + timedelta(minutes=self.poll_interval_minutes)
+                # Schedule the next poll relative to the previous one, so time
+                # spent polling does not accumulate as drift
+                next_wake += interval_seconds
+                if next_wake >= deadline:
+                    break
+
+                sleep_seconds = max(0.0, next_wake - time.monotonic())
+                next_poll = datetime.now() + timedelta(seconds=sleep_seconds)
                 print(f"\n⏰ Next poll at: {next_poll.strftime('%H:%M:%S')}")
 
-                # Sleep until next poll
-                if datetime.now() < end_time:
-                    sleep_seconds = self.poll_interval_minutes * 60
-
-                    # Show countdown for first minute, then sleep silently
-                    if sleep_seconds >= 60:
-                        print("Sleeping for 1 minute...", end='', flush=True)
-                        time.sleep(60)
-                        remaining = sleep_seconds - 60
-                        if remaining > 0:
-                            print(f" sleeping {remaining/60:.1f} more minutes...")
-                            time.sleep(remaining)
-                    else:
-                        time.sleep(sleep_seconds)
+                # Show countdown for first minute, then sleep silently
+                if sleep_seconds >= 60:
+                    print("Sleeping for 1 minute...", end='', flush=True)
+                    time.sleep(60)
+                    remaining = next_wake - time.monotonic()
+                    if remaining > 0:
+                        print(f" sleeping {remaining/60:.1f} more minutes...")
+                        time.sleep(remaining)
+                else:
+                    time.sleep(sleep_seconds)
 
         except KeyboardInterrupt:
             print("\n\n⚠️  Test interrupted by user")
+        finally:
+            log_fh.close()
 
         # Generate and save summary
         print(f"\n{'='*70}")
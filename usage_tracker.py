@@ -39,21 +39,21 @@ class ClaudeUsageTracker:
         end_date = stats.date_range[1].date()
         result = {}
 
+        # Per-day cost is approximate - we'd need per-day per-model breakdown
+        # for accuracy - so every active day gets the same average, computed once
+        daily_cost = 0.0
+        for model, model_usage in stats.by_model.items():
+            daily_cost += self.parser.calculate_cost(model_usage, model) / len(stats.by_date)
+
         for i in range(days - 1, -1, -1):
             date = end_date - timedelta(days=i)
-            date_key = date.strftime("%Y-%m-%d")
+            date_key = date.isoformat()
             usage = stats.by_date.get(date_key)
 
             if usage:
-                # Calculate cost for this day
-                cost = 0.0
-                for model, model_usage in stats.by_model.items():
-                    # This is approximate - we'd need per-day per-model breakdown for accuracy
-                    cost += self.parser.calculate_cost(model_usage, model) / len(stats.by_date)
-
                 result[date_key] = {
                     "tokens": usage.total_tokens,
-                    "cost": cost,
+                    "cost": daily_cost,
                     "usage": usage
                 }
             else:
@@ -100,6 +100,10 @@ class ClaudeUsageTracker:
             print(f"   Cache hit ratio: {cache_ratio:.1f}x")
             print(f"   (Reading {cache_ratio:.1f} tokens for every 1 token created)")
 
+        # Share of total tokens, as a multiplier shared by both breakdowns
+        total_tokens = stats.total_usage.total_tokens
+        pct_scale = 100.0 / total_tokens if total_tokens else 0.0
+
         # Cost breakdown
         print(f"\n💰 Cost Breakdown by Model:")
         total_cost = 0.0
@@ -108,7 +112,7 @@ class ClaudeUsageTracker:
                                    reverse=True):
             cost = self.parser.calculate_cost(usage, model)
             total_cost += cost
-            pct = (usage.total_tokens / stats.total_usage.total_tokens) * 100
+            pct = usage.total_tokens * pct_scale
             print(f"   {model:40s} ${cost:>8.2f} ({pct:>5.1f}%)")
 
         print(f"   {'─' * 60}")
@@ -119,7 +123,7 @@ class ClaudeUsageTracker:
         for project, usage in sorted(stats.by_project.items(),
                                      key=lambda x: x[1].total_tokens,
                                      reverse=True):
-            pct = (usage.total_tokens / stats.total_usage.total_tokens) * 100
+            pct = usage.total_tokens * pct_scale
             print(f"   {project:40s} {usage.total_tokens:>12,} ({pct:>5.1f}%)")
 
         # Last 7 days
@@ -15,10 +15,21 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+# Daemon log line patterns, compiled once for the per-line scan
+_TIMESTAMP_RE = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
+_POLL_RE = re.compile(r'Poll #(\d+)')
+_SESSION_RE = re.compile(r'Session: ([\d.]+)% used, resets (\S+)')
+_EXTRA_RE = re.compile(r'Extra: \$([\d.]+) / \$([\d.]+)')
+
 
 class LogEntry:
     """Represents a single daemon poll with session and extra usage data."""
 
+    __slots__ = (
+        "timestamp", "poll_num", "session_percent", "session_reset_time",
+        "extra_spent", "extra_limit",
+    )
+
     def __init__(self, timestamp: datetime, poll_num: int):
         self.timestamp = timestamp
         self.poll_num = poll_num
@@ -40,16 +51,29 @@ def parse_daemon_log(log_file: Path, start_time: datetime, end_time: datetime) -
     entries = []
     current_entry = None
 
+    # Log timestamps sort the same as strings, so lines outside the window can
+    # be skipped without building a datetime (truncating both bounds to whole
+    # seconds keeps this conservative; the exact check follows below). The
+    # scan still reads to the end of the file: local-time stamps step back
+    # when DST ends, so in-window lines can follow later ones.
+    start_key = start_time.strftime('%Y-%m-%d %H:%M:%S')
+    end_key = end_time.strftime('%Y-%m-%d %H:%M:%S')
+
     with open(log_file, 'r') as f:
         for line in f:
             # Parse timestamp
-            timestamp_match = re.match(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
+            timestamp_match = _TIMESTAMP_RE.match(line)
             if not timestamp_match:
                 continue
 
             timestamp_str = timestamp_match.group(1)
+            if timestamp_str < start_key or timestamp_str > end_key:
+                continue
+
             try:
-                timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
+                # The pattern already fixed the layout; fromisoformat parses it
+                # in C without strptime's format interpretation
+                timestamp = datetime.fromisoformat(timestamp_str)
             except ValueError:
                 continue
 
@@ -57,8 +81,10 @@ def parse_daemon_log(log_file: Path, start_time: datetime, end_time: datetime) -
             if timestamp < start_time or timestamp > end_time:
                 continue
 
+            # Each field has a fixed literal marker; checking for it with `in`
+            # lets most lines skip the regex search entirely
             # Poll number
-            poll_match = re.search(r'Poll #(\d+)', line)
+            poll_match = 'Poll #' in line and _POLL_RE.search(line)
             if poll_match:
                 if current_entry:
                     entries.append(current_entry)
@@ -69,14 +95,14 @@ def parse_daemon_log(log_file: Path, start_time: datetime, end_time: datetime) -
                 continue
 
             # Session data
-            session_match = re.search(r'Session: ([\d.]+)% used, resets (\S+)', line)
+            session_match = 'Session: ' in line and _SESSION_RE.search(line)
             if session_match:
                 current_entry.session_percent = float(session_match.group(1))
                 current_entry.session_reset_time = session_match.group(2)
                 continue
 
             # Extra usage data
-            extra_match = re.search(r'Extra: \$([\d.]+) / \$([\d.]+)', line)
+            extra_match = 'Extra: $' in line and _EXTRA_RE.search(line)
             if extra_match:
                 current_entry.extra_spent = float(extra_match.group(1))
                 current_entry.extra_limit = float(extra_match.group(2))
@@ -109,7 +135,9 @@ def detect_session_resets(entries: List[LogEntry]) -> List[int]:
 
 def format_timestamp(dt: datetime) -> str:
     """Format datetime for display."""
-    return dt.strftime('%Y-%m-%d %H:%M:%S')
+    # Same output as strftime('%Y-%m-%d %H:%M:%S') for the naive log
+    # timestamps, without interpreting a format string per call
+    return dt.isoformat(' ', 'seconds')
 
 
 def analyze_segment(entries: List[LogEntry], start_idx: int, end_idx: int, segment_name: str):
@@ -159,10 +187,26 @@ def analyze_segment(entries: List[LogEntry], start_idx: int, end_idx: int, segme
     print(f"{'Poll #':<8} {'Timestamp':<20} {'Session':<15} {'Extra':<15}")
     print(f"{'-'*80}")
 
+    # One row per poll, so build the table and write it in a single call
+    rows = []
     for entry in entries[start_idx:end_idx]:
         session_str = f"{entry.session_percent:.0f}%" if entry.has_session_data() else "N/A"
         extra_str = f"${entry.extra_spent:.2f}" if entry.has_extra_data() else "N/A"
-        print(f"{entry.poll_num:<8} {format_timestamp(entry.timestamp):<20} {session_str:<15} {extra_str:<15}")
+        rows.append(f"{entry.poll_num:<8} {format_timestamp(entry.timestamp):<20} {session_str:<15} {extra_str:<15}")
+    print("\n".join(rows))
+
+
+def read_timestamp(prompt: str) -> datetime:
+    """Prompt until the user enters a valid YYYY-MM-DD HH:MM:SS timestamp."""
+    while True:
+        text = input(prompt).strip()
+        # Check the layout first; strptime also accepts unpadded fields
+        if _TIMESTAMP_RE.fullmatch(text):
+            try:
+                return datetime.strptime(text, '%Y-%m-%d %H:%M:%S')
+            except ValueError:
+                pass  # Right layout, impossible date or time
+        print("❌ Invalid format. Please use: YYYY-MM-DD HH:MM:SS")
 
 
 def main():
@@ -189,21 +233,8 @@ def main():
     print("Example: 2026-01-11 00:00:00")
     print()
 
-    while True:
-        start_str = input("Start of no-work window: ").strip()
-        try:
-            start_time = datetime.strptime(start_str, '%Y-%m-%d %H:%M:%S')
-            break
-        except ValueError:
-            print("❌ Invalid format. Please use: YYYY-MM-DD HH:MM:SS")
-
-    while True:
-        end_str = input("End of no-work window:   ").strip()
-        try:
-            end_time = datetime.strptime(end_str, '%Y-%m-%d %H:%M:%S')
-            break
-        except ValueError:
-            print("❌ Invalid format. Please use: YYYY-MM-DD HH:MM:SS")
+    start_time = read_timestamp("Start of no-work window: ")
+    end_time = read_timestamp("End of no-work window:   ")
 
     if end_time <= start_time:
         print("❌ Error: End time must be after start time")